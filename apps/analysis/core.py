@@ -136,7 +136,7 @@ class Pipeline:
         unique_id = uuid.uuid4().hex
         log = _create_logger("pipeline", unique_id)
         if pipeline_context.log_handler_factory:
-            log.addHandler(pipeline_context.log_handler_factory(unique_id))
+            _add_log_handler(log, pipeline_context.log_handler_factory(unique_id))
 
         def _run_step(step, context):
             if isinstance(context, list):
@@ -274,7 +274,7 @@ class BaseStep(Generic[PipeIn, PipeOut]):
         self.id = uuid.uuid4().hex
         self.log = _create_logger(self.name, self.id)
         if self.pipeline_context.log_handler_factory:
-            self.log.addHandler(self.pipeline_context.log_handler_factory(self.id))
+            _add_log_handler(self.log, self.pipeline_context.log_handler_factory(self.id))
 
     def invoke(
         self, context: StepContext[PipeIn], pipeline_context: PipelineContext
@@ -285,7 +285,7 @@ class BaseStep(Generic[PipeIn, PipeOut]):
             self.params.check()
             self.preflight_check(context)
 
-            self.log.debug(f"Params: {self.params}")
+            self.log.debug("Params: %s", self.params)
             result = self.run(self.params, context)
             for res in [result] if isinstance(result, StepContext) else result:
                 if not res.name:
@@ -322,3 +322,10 @@ def _create_logger(name, unique_id):
     log.setLevel(logging.DEBUG)
     ignore_logger(log_name)
     return log
+
+
+def _add_log_handler(log: logging.Logger, handler: logging.Handler):
+    """Attach the handler and raise the logger's level to match so that records the handler would discard
+    are never created."""
+    log.addHandler(handler)
+    log.setLevel(handler.level)
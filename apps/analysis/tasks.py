@@ -1,6 +1,6 @@
 import logging
 from contextlib import contextmanager
-from datetime import datetime
+from datetime import UTC, datetime
 
 from celery import chord, shared_task
 from celery import group as celery_group
@@ -67,27 +67,27 @@ def run_context(run, bubble_errors=True):
 
 
 class RunLogHandler(logging.Handler):
-    def __init__(self, run, step_id: str):
+    def __init__(self, run, step_id: str, level=logging.DEBUG):
         self.run = run
         self.step_id = step_id
-        super().__init__(level=logging.DEBUG)
+        self._logger_suffix = f"_{step_id}"
+        super().__init__(level=level)
 
     def emit(self, record: logging.LogRecord):
-        name = record.name.removesuffix(f"_{self.step_id}")
+        name = record.name.removesuffix(self._logger_suffix)
         self.save_log(
             {
                 "level": record.levelname,
                 "message": record.getMessage(),
                 "logger": name,
-                "timestamp": datetime.utcnow().isoformat(timespec="milliseconds"),
+                "timestamp": datetime.fromtimestamp(record.created, tz=UTC).isoformat(timespec="milliseconds"),
             }
         )
 
     def save_log(self, log):
-        self.run.refresh_from_db(fields=["log"])
-        logs = self.run.log.get("entries", [])
-        # TODO: this is very inefficient - make it better
-        self.run.log = {"entries": logs + [log]}
+        # The log handlers are the only writers of the run log and they share this run instance, so append
+        # in place instead of re-reading the log and copying the entries for every record.
+        self.run.log.setdefault("entries", []).append(log)
         self.run.save(update_fields=["log"])
 
     def __hash__(self):
@@ -95,11 +95,12 @@ class RunLogHandler(logging.Handler):
 
 
 class LogHandlerFactory:
-    def __init__(self, run):
+    def __init__(self, run, min_level=logging.DEBUG):
         self.run = run
+        self.min_level = min_level
 
     def __call__(self, step_id):
-        return RunLogHandler(self.run, step_id)
+        return RunLogHandler(self.run, step_id, level=self.min_level)
 
 
 @shared_task
@@ -1,11 +1,13 @@
+import logging
+
 from apps.analysis.core import NoParams, PipelineContext, StepContext
 from apps.analysis.tasks import RunLogHandler
 from apps.analysis.tests.demo_steps import StrInt
 
 
 class FakeHandler(RunLogHandler):
-    def __init__(self, logs, step_id):
-        super().__init__(None, step_id)
+    def __init__(self, logs, step_id, level=logging.DEBUG):
+        super().__init__(None, step_id, level=level)
         self.logs = logs
 
     def save_log(self, log):
@@ -36,3 +38,14 @@ def check_logs(logs):
         ("StrInt", "Params: "),
         ("StrInt", "Step StrInt complete"),
     ]
+
+
+def test_logging_min_level():
+    logs = []
+    step = StrInt(params=NoParams())
+    pipeline_context = PipelineContext(
+        log_handler_factory=lambda step_id: FakeHandler(logs, step_id, level=logging.INFO)
+    )
+    step.invoke(StepContext.initial("1"), pipeline_context)
+    assert [entry["message"] for entry in logs] == ["Running step StrInt", "Step StrInt complete"]
+    assert not step.log.isEnabledFor(logging.DEBUG)
@@ -3,6 +3,7 @@ from functools import cached_property
 from django.contrib.contenttypes.fields import GenericForeignKey, GenericRelation
 from django.contrib.contenttypes.models import ContentType
 from django.db import models, transaction
+from django.db.models import Prefetch
 from django.urls import reverse
 from django.utils.translation import gettext_lazy as _
 from django.utils.translation import pgettext_lazy
@@ -93,6 +94,14 @@ class TaggedModelMixin(models.Model, AnnotationMixin):
         for tag in tag_objs:
             self.tags.add(tag, through_defaults={"team": team, "user": added_by})
 
+    @classmethod
+    def prefetch_tags(cls, queryset):
+        """Prefetch the tags linked to each object in `queryset` so that `get_linked_tags` does not
+        need to query the database per object."""
+        return queryset.prefetch_related(
+            Prefetch("tagged_items", queryset=CustomTaggedItem.objects.select_related("tag"))
+        )
+
     @property
     def get_linked_tags(self):
         # return [{"user": item.user.username, "tag": item.tag.name} for item in self.tagged_items.all()]
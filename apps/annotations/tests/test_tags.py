@@ -132,3 +132,22 @@ def test_unlink_tag_returns_404(tag, client):
     data = {"tag_name": tag.name, "object_info": object_info_json}
     response = client.post(reverse("annotations:unlink_tag", kwargs={"team_slug": tag.team.slug}), data=data)
     assert response.status_code == 404
+
+
+@pytest.mark.django_db()
+def test_prefetched_linked_tags(tag, team, django_assert_num_queries):
+    chats = [Chat.objects.create(team=team), Chat.objects.create(team=team)]
+    for chat in chats:
+        chat.tags.add(tag, through_defaults={"team": team})
+
+    with django_assert_num_queries(2):
+        chats = list(Chat.prefetch_tags(Chat.objects.filter(id__in=[chat.id for chat in chats])))
+        assert [chat.get_linked_tags for chat in chats] == [["testing"], ["testing"]]
+
+
+@pytest.mark.django_db()
+def test_linked_tags_reflect_added_tags(tag, team):
+    chat = Chat.objects.create(team=team)
+    assert chat.get_linked_tags == []
+    chat.add_tags([tag.name], team=team, added_by=None)
+    assert chat.get_linked_tags == ["testing"]
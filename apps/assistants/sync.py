@@ -1,10 +1,13 @@
 import mimetypes
-import pathlib
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
 from functools import wraps
-from io import BytesIO
 
 import openai
+import tenacity
 from openai import OpenAI
+from openai.types import FileObject
 from openai.types.beta import Assistant
 
 from apps.assistants.models import OpenAiAssistant, ToolResources
@@ -13,25 +16,37 @@ from apps.files.models import File
 from apps.service_providers.models import LlmProvider
 from apps.teams.models import Team
 
+MAX_CONCURRENT_REQUESTS = 8
+
 
 class OpenAiSyncError(Exception):
     pass
 
 
+@contextmanager
+def _openai_errors():
+    """Converts OpenAI API errors raised within the block into `OpenAiSyncError`."""
+    try:
+        yield
+    except openai.APIError as e:
+        message = e.message
+        if isinstance(e.body, dict):
+            try:
+                message = e.body["message"]
+            except (KeyError, AttributeError):
+                pass
+
+        raise OpenAiSyncError(message) from e
+
+
 def wrap_openai_errors(fn):
+    """Decorator for the public entry points of this module. Private helpers are only ever called from within
+    a wrapped function so they don't need wrapping themselves."""
+
     @wraps(fn)
     def _inner(*args, **kwargs):
-        try:
+        with _openai_errors():
             return fn(*args, **kwargs)
-        except openai.APIError as e:
-            message = e.message
-            if isinstance(e.body, dict):
-                try:
-                    message = e.body["message"]
-                except KeyError | AttributeError:
-                    pass
-
-            raise OpenAiSyncError(message) from e
 
     return _inner
 
@@ -41,7 +56,7 @@ def push_assistant_to_openai(assistant: OpenAiAssistant):
     """Pushes the assistant to OpenAI. If the assistant already exists, it will be updated."""
     client = assistant.llm_provider.get_llm_service().get_raw_client()
     data = _ocs_assistant_to_openai_kwargs(assistant)
-    data["tool_resources"] = _sync_tool_resources(assistant)
+    data["tool_resources"] = _sync_tool_resources(client, assistant)
     if assistant.assistant_id:
         client.beta.assistants.update(assistant.assistant_id, **data)
     else:
@@ -52,6 +67,10 @@ def push_assistant_to_openai(assistant: OpenAiAssistant):
 
 @wrap_openai_errors
 def delete_file_from_openai(client: OpenAI, file: File):
+    _delete_file_from_openai(client, file)
+
+
+def _delete_file_from_openai(client: OpenAI, file: File):
     if not file.external_id or file.external_source != "openai":
         return
 
@@ -71,7 +90,7 @@ def sync_from_openai(assistant: OpenAiAssistant):
     for key, value in _openai_assistant_to_ocs_kwargs(openai_assistant).items():
         setattr(assistant, key, value)
     assistant.save()
-    _sync_tool_resources_from_openai(openai_assistant, assistant)
+    _sync_tool_resources_from_openai(client, openai_assistant, assistant)
 
 
 @wrap_openai_errors
@@ -80,7 +99,7 @@ def import_openai_assistant(assistant_id: str, llm_provider: LlmProvider, team:
     openai_assistant = client.beta.assistants.retrieve(assistant_id)
     kwargs = _openai_assistant_to_ocs_kwargs(openai_assistant, team=team, llm_provider=llm_provider)
     assistant = OpenAiAssistant.objects.create(**kwargs)
-    _sync_tool_resources_from_openai(openai_assistant, assistant)
+    _sync_tool_resources_from_openai(client, openai_assistant, assistant)
     return assistant
 
 
@@ -98,34 +117,36 @@ def delete_openai_assistant(assistant: OpenAiAssistant):
             client.beta.vector_stores.delete(vector_store_id=vector_store_id)
 
         for file in resource.files.all():
-            delete_file_from_openai(client, file)
+            _delete_file_from_openai(client, file)
 
 
-def _fetch_file_from_openai(assistant: OpenAiAssistant, file_id: str) -> File:
-    client = assistant.llm_provider.get_llm_service().get_raw_client()
-    openai_file = client.files.retrieve(file_id)
-    filename = openai_file.filename
-    try:
-        filename = pathlib.Path(openai_file.filename).name
-    except Exception:
-        pass
+def _fetch_files_from_openai_bulk(client: OpenAI, assistant: OpenAiAssistant, file_ids: list[str]) -> list[File]:
+    """Create local `File` records for the given remote file IDs using a single insert."""
+    if not file_ids:
+        return []
+    # fetch the file metadata concurrently, the model instances are built on this thread
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as executor:
+        openai_files = list(executor.map(client.files.retrieve, file_ids))
+    files = [_build_file_from_openai(assistant, openai_file) for openai_file in openai_files]
+    return File.objects.bulk_create(files)
 
+
+def _build_file_from_openai(assistant: OpenAiAssistant, openai_file: FileObject) -> File:
+    filename = os.path.basename(openai_file.filename)
     content_type = mimetypes.guess_type(filename)[0]
-    file = File(
+    # Can't retrieve content from openai assistant files
+    # content = client.files.retrieve_content(openai_file.id)
+    # file.file.save(filename, ContentFile(content.read()))
+    return File(
         team=assistant.team,
         name=filename,
         content_type=content_type,
         external_id=openai_file.id,
         external_source="openai",
     )
-    # Can't retrieve content from openai assistant files
-    # content = client.files.retrieve_content(openai_file.id)
-    # file.file.save(filename, ContentFile(content.read()))
-    file.save()
-    return file
 
 
-def _sync_tool_resources_from_openai(openai_assistant: Assistant, assistant: OpenAiAssistant):
+def _sync_tool_resources_from_openai(client: OpenAI, openai_assistant: Assistant, assistant: OpenAiAssistant):
     tools = {tool.type for tool in openai_assistant.tools}
     if "code_interpreter" in tools:
         ocs_code_interpreter, _ = ToolResources.objects.get_or_create(assistant=assistant, tool_type="code_interpreter")
@@ -134,7 +155,7 @@ def _sync_tool_resources_from_openai(openai_assistant: Assistant, assistant: Ope
         except AttributeError:
             pass
         else:
-            _sync_tool_resource_files_from_openai(code_file_ids, ocs_code_interpreter)
+            _sync_tool_resource_files_from_openai(client, code_file_ids, ocs_code_interpreter)
 
     if "file_search" in tools:
         ocs_file_search, _ = ToolResources.objects.get_or_create(assistant=assistant, tool_type="file_search")
@@ -146,44 +167,57 @@ def _sync_tool_resources_from_openai(openai_assistant: Assistant, assistant: Ope
             if ocs_file_search.extra.get("vector_store_id") != vector_store_id:
                 ocs_file_search.extra["vector_store_id"] = vector_store_id
                 ocs_file_search.save()
-            client = assistant.llm_provider.get_llm_service().get_raw_client()
-            file_ids = (
+            file_ids = [
                 file.id
                 for file in client.beta.vector_stores.files.list(
                     vector_store_id=vector_store_id  # there can only be one
                 )
-            )
-            _sync_tool_resource_files_from_openai(file_ids, ocs_file_search)
+            ]
+            _sync_tool_resource_files_from_openai(client, file_ids, ocs_file_search)
 
 
-def _sync_tool_resource_files_from_openai(file_ids, ocs_resource):
-    resource_files = ocs_resource.files.all()
-    unused_files = {file.id for file in resource_files}
-    existing_files = {file.external_id: file for file in resource_files if file.external_id}
+def _sync_tool_resource_files_from_openai(client, file_ids, ocs_resource):
+    resource_files = list(ocs_resource.files.all().only("id", "external_id"))
+    unused_files = set()
+    existing_files = {}
+    for file in resource_files:
+        unused_files.add(file.id)
+        if file.external_id:
+            existing_files[file.external_id] = file
+
+    new_file_ids = []
     for file_id in file_ids:
         try:
             file = existing_files.pop(file_id)
-            unused_files.remove(file.id)
+            unused_files.discard(file.id)
         except KeyError:
-            ocs_resource.files.add(_fetch_file_from_openai(ocs_resource.assistant, file_id))
+            new_file_ids.append(file_id)
+
+    if new_files := _fetch_files_from_openai_bulk(client, ocs_resource.assistant, new_file_ids):
+        # `files.add` inserts the links in arbitrary order, create them directly to keep the remote ordering
+        ToolResources.files.through.objects.bulk_create(
+            [ToolResources.files.through(toolresources=ocs_resource, file=file) for file in new_files]
+        )
     if unused_files:
         File.objects.filter(id__in=unused_files).delete()
 
 
-def _sync_vector_store_files_to_openai(client, vector_store_id, files_ids: list[str]):
-    vector_store_files = (file.id for file in client.beta.vector_stores.files.list(vector_store_id=vector_store_id))
-    to_delete_remote = []
-    for file_id in vector_store_files:
-        try:
-            files_ids.remove(file_id)
-        except ValueError:
-            to_delete_remote.append(file_id)
+def _get_vector_store_file_ids(client, vector_store_id) -> set[str]:
+    return {file.id for file in client.beta.vector_stores.files.list(vector_store_id=vector_store_id)}
+
+
+def _sync_vector_store_files_to_openai(
+    client, vector_store_id, files_ids: list[str], remote_file_ids: set[str] | None = None
+):
+    if remote_file_ids is None:
+        remote_file_ids = _get_vector_store_file_ids(client, vector_store_id)
+    local_file_ids = set(files_ids)
 
-    for file_id in to_delete_remote:
+    for file_id in remote_file_ids - local_file_ids:
         client.beta.vector_stores.files.delete(vector_store_id=vector_store_id, file_id=file_id)
 
-    if files_ids:
-        client.beta.vector_stores.file_batches.create(vector_store_id=vector_store_id, file_ids=files_ids)
+    if to_add := [file_id for file_id in files_ids if file_id not in remote_file_ids]:
+        client.beta.vector_stores.file_batches.create(vector_store_id=vector_store_id, file_ids=to_add)
 
 
 def _ocs_assistant_to_openai_kwargs(assistant: OpenAiAssistant) -> dict:
@@ -201,18 +235,18 @@ def _ocs_assistant_to_openai_kwargs(assistant: OpenAiAssistant) -> dict:
     }
 
 
-def _sync_tool_resources(assistant):
+def _sync_tool_resources(client, assistant):
     resource_data = {}
     resources = {resource.tool_type: resource for resource in assistant.tool_resources.all()}
     if code_interpreter := resources.get("code_interpreter"):
-        file_ids = _create_files_remote(assistant, code_interpreter.files.all())
+        file_ids = _create_files_remote(client, code_interpreter.files.all())
         resource_data["code_interpreter"] = {"file_ids": file_ids}
 
     if file_search := resources.get("file_search"):
-        file_ids = _create_files_remote(assistant, file_search.files.all())
+        file_ids = _create_files_remote(client, file_search.files.all())
         store_id = file_search.extra.get("vector_store_id")
         updated_store_id = _update_or_create_vector_store(
-            assistant, f"{assistant.name} - File Search", store_id, file_ids
+            client, assistant, f"{assistant.name} - File Search", store_id, file_ids
         )
         if store_id != updated_store_id:
             file_search.extra["vector_store_id"] = updated_store_id
@@ -222,15 +256,18 @@ def _sync_tool_resources(assistant):
     return resource_data
 
 
-def _update_or_create_vector_store(assistant, name, vector_store_id, file_ids) -> str:
-    client = assistant.llm_provider.get_llm_service().get_raw_client()
+def _update_or_create_vector_store(client, assistant, name, vector_store_id, file_ids) -> str:
     if vector_store_id:
+        # listing the store's files doubles as the existence check so no separate `retrieve` is needed
         try:
-            client.beta.vector_stores.retrieve(vector_store_id)
+            remote_file_ids = _get_vector_store_file_ids(client, vector_store_id)
         except openai.NotFoundError:
             vector_store_id = None
+        else:
+            _sync_vector_store_files_to_openai(client, vector_store_id, file_ids, remote_file_ids)
+            return vector_store_id
 
-    if not vector_store_id and assistant.assistant_id:
+    if assistant.assistant_id:
         # check if there is a vector store attached to this assistant that we don't know about
         openai_assistant = client.beta.assistants.retrieve(assistant.assistant_id)
         try:
@@ -265,23 +302,40 @@ def _openai_assistant_to_ocs_kwargs(assistant: Assistant, team=None, llm_provide
     return kwargs
 
 
-def _create_files_remote(assistant, files):
-    file_ids = []
-    for file in files:
-        if not file.external_id:
-            _push_file_to_openai(assistant, file)
-        file_ids.append(file.external_id)
-    return file_ids
-
-
-def _push_file_to_openai(assistant: OpenAiAssistant, file: File):
-    client = assistant.llm_provider.get_llm_service().get_raw_client()
+def _create_files_remote(client, files):
+    files = list(files)
+    pending = [file for file in files if not file.external_id]
+    if pending:
+        # uploads are I/O bound so run them concurrently, DB writes stay on this thread
+        error = None
+        with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as executor:
+            futures = {executor.submit(_upload_file_to_openai, client, file): file for file in pending}
+            for future in as_completed(futures):
+                try:
+                    openai_file = future.result()
+                except Exception as e:
+                    # keep saving the other uploads so they aren't orphaned and re-uploaded on the next sync
+                    error = error or e
+                    continue
+                file = futures[future]
+                file.external_id = openai_file.id
+                file.external_source = "openai"
+                file.save()
+        if error:
+            raise error
+    return [file.external_id for file in files]
+
+
+@tenacity.retry(
+    retry=tenacity.retry_if_exception_type(openai.RateLimitError),
+    wait=tenacity.wait_exponential_jitter(),
+    stop=tenacity.stop_after_attempt(3),
+    reraise=True,
+)
+def _upload_file_to_openai(client: OpenAI, file: File):
+    # pass the open handle through so the SDK streams the upload instead of us buffering the whole file
     with file.file.open("rb") as fh:
-        bytesio = BytesIO(fh.read())
-    openai_file = client.files.create(
-        file=(file.name, bytesio),
-        purpose="assistants",
-    )
-    file.external_id = openai_file.id
-    file.external_source = "openai"
-    file.save()
+        return client.files.create(
+            file=(file.name, fh, file.content_type or "application/octet-stream"),
+            purpose="assistants",
+        )
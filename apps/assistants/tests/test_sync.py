@@ -2,10 +2,13 @@ import dataclasses
 from io import BytesIO
 from unittest.mock import call, patch
 
+import httpx
+import openai
 import pytest
 
 from apps.assistants.models import ToolResources
 from apps.assistants.sync import (
+    OpenAiSyncError,
     delete_openai_assistant,
     import_openai_assistant,
     push_assistant_to_openai,
@@ -51,10 +54,32 @@ def test_push_assistant_to_openai_create(mock_file_create, assistant_create, vs_
     assert search_resource.extra == {"vector_store_id": "vs_123"}
 
 
+@pytest.mark.django_db()
+@patch("openai.resources.beta.Assistants.create")
+def test_push_assistant_to_openai_saves_uploaded_files_when_an_upload_fails(assistant_create):
+    local_assistant = OpenAiAssistantFactory(builtin_tools=["code_interpreter"])
+    files = FileFactory.create_batch(3)
+    code_resource = ToolResources.objects.create(tool_type="code_interpreter", assistant=local_assistant)
+    code_resource.files.set(files)
+
+    upload_error = openai.APIConnectionError(request=httpx.Request("POST", "https://api.openai.com"))
+    side_effect = [*FileObjectFactory.create_batch(2), upload_error]
+    with patch("openai.resources.Files.create", side_effect=side_effect) as mock_file_create:
+        with pytest.raises(OpenAiSyncError):
+            push_assistant_to_openai(local_assistant)
+
+    assert mock_file_create.call_count == 3
+    assert not assistant_create.called
+    uploaded_ids = {file.id for file in side_effect[:2]}
+    for file in files:
+        file.refresh_from_db()
+    assert {file.external_id for file in files if file.external_id} == uploaded_ids
+
+
 @pytest.mark.django_db()
 @patch("openai.resources.beta.vector_stores.file_batches.FileBatches.create")
 @patch("openai.resources.beta.vector_stores.files.Files.list")
-@patch("openai.resources.beta.vector_stores.VectorStores.retrieve", return_value=ObjectWithId(id="vs_123"))
+@patch("openai.resources.beta.vector_stores.VectorStores.retrieve")
 @patch("openai.resources.beta.Assistants.update")
 def test_push_assistant_to_openai_update(mock_update, vs_retrieve, vs_files_list, file_batches):
     local_assistant = OpenAiAssistantFactory(assistant_id="test_id", builtin_tools=["code_interpreter", "file_search"])
@@ -77,7 +102,8 @@ def test_push_assistant_to_openai_update(mock_update, vs_retrieve, vs_files_list
     with patch("openai.resources.Files.create", side_effect=openai_files) as mock_file_create:
         push_assistant_to_openai(local_assistant)
     assert mock_update.called
-    assert vs_retrieve.called
+    assert not vs_retrieve.called
+    assert vs_files_list.called
     assert mock_file_create.call_count == 2
 
     assert file_batches.call_args_list == [
@@ -91,6 +117,58 @@ def test_push_assistant_to_openai_update(mock_update, vs_retrieve, vs_files_list
         assert file.external_source == "openai"
 
 
+@pytest.mark.django_db()
+@patch("openai.resources.beta.vector_stores.VectorStores.create", return_value=ObjectWithId(id="vs_456"))
+@patch("openai.resources.beta.vector_stores.files.Files.list")
+@patch("openai.resources.beta.Assistants.retrieve")
+@patch("openai.resources.beta.Assistants.update")
+def test_push_assistant_to_openai_update_missing_vector_store(mock_update, mock_retrieve, vs_files_list, vs_create):
+    local_assistant = OpenAiAssistantFactory(assistant_id="test_id", builtin_tools=["file_search"])
+    search_resource = ToolResources.objects.create(
+        tool_type="file_search", assistant=local_assistant, extra={"vector_store_id": "vs_123"}
+    )
+    search_resource.files.set(FileFactory.create_batch(1, external_id="file_123", external_source="openai"))
+
+    vs_files_list.side_effect = openai.NotFoundError(
+        "not found", response=httpx.Response(404, request=httpx.Request("GET", "https://api.openai.com")), body=None
+    )
+    remote_assistant = AssistantFactory()
+    remote_assistant.tool_resources.file_search.vector_store_ids = []
+    mock_retrieve.return_value = remote_assistant
+
+    push_assistant_to_openai(local_assistant)
+    vs_create.assert_called_with(name=f"{local_assistant.name} - File Search", file_ids=["file_123"])
+    search_resource.refresh_from_db()
+    assert search_resource.extra == {"vector_store_id": "vs_456"}
+
+
+@pytest.mark.django_db()
+@patch("openai.resources.beta.vector_stores.VectorStores.create")
+@patch("openai.resources.beta.vector_stores.file_batches.FileBatches.create")
+@patch("openai.resources.beta.vector_stores.files.Files.list", return_value=[])
+@patch("openai.resources.beta.Assistants.retrieve")
+@patch("openai.resources.beta.Assistants.update")
+def test_push_assistant_to_openai_file_error_does_not_replace_vector_store(
+    mock_update, mock_retrieve, vs_files_list, file_batches, vs_create
+):
+    local_assistant = OpenAiAssistantFactory(assistant_id="test_id", builtin_tools=["file_search"])
+    search_resource = ToolResources.objects.create(
+        tool_type="file_search", assistant=local_assistant, extra={"vector_store_id": "vs_123"}
+    )
+    search_resource.files.set(FileFactory.create_batch(1, external_id="file_123", external_source="openai"))
+
+    remote_assistant = AssistantFactory()
+    remote_assistant.tool_resources.file_search.vector_store_ids = []
+    mock_retrieve.return_value = remote_assistant
+    not_found = httpx.Response(404, request=httpx.Request("POST", "https://api.openai.com"))
+    file_batches.side_effect = openai.NotFoundError("file not found", response=not_found, body=None)
+    with pytest.raises(OpenAiSyncError):
+        push_assistant_to_openai(local_assistant)
+    assert not vs_create.called
+    search_resource.refresh_from_db()
+    assert search_resource.extra == {"vector_store_id": "vs_123"}
+
+
 @pytest.mark.django_db()
 @patch("openai.resources.beta.vector_stores.files.Files.list")
 @patch("openai.resources.beta.Assistants.retrieve")
@@ -110,8 +188,9 @@ def test_sync_from_openai(mock_file_retrieve, _, mock_retrieve, mock_vector_stor
     # mock the assistant api call
     mock_retrieve.return_value = remote_assistant
 
-    # this will return one file from the list on each call to the mock
-    mock_file_retrieve.side_effect = openai_files
+    # files are retrieved concurrently so look them up by ID rather than relying on call order
+    openai_files_by_id = {file.id: file for file in openai_files}
+    mock_file_retrieve.side_effect = lambda file_id: openai_files_by_id[file_id]
 
     # mock the vector store file call
     mock_vector_store_files.return_value = [FileObjectFactory(id=file.id) for file in file_search_files_expected]
@@ -172,8 +251,9 @@ def test_import_openai_assistant(_, mock_file_retrieve, mock_vector_store_files,
     # mock the vector store file call
     mock_vector_store_files.return_value = [FileObjectFactory(id=file.id) for file in file_search_files_expected]
 
-    # this will return one file from the list on each call to the mock
-    mock_file_retrieve.side_effect = openai_files
+    # files are retrieved concurrently so look them up by ID rather than relying on call order
+    openai_files_by_id = {file.id: file for file in openai_files}
+    mock_file_retrieve.side_effect = lambda file_id: openai_files_by_id[file_id]
 
     llm_provider = LlmProviderFactory()
     imported_assistant = import_openai_assistant("123", llm_provider, llm_provider.team)
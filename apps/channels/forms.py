@@ -25,13 +25,13 @@ class ChannelForm(forms.ModelForm):
 
     def _populate_available_message_providers(self, team: Team, platform: ChannelPlatform):
         provider_types = MessagingProviderType.platform_supported_provider_types(platform)
-        queryset = MessagingProvider.objects.filter(team=team)
         # We must let the default queryset filter for the specific team
-        self.fields["messaging_provider"].queryset = queryset
+        queryset = MessagingProvider.objects.filter(team=team)
         if provider_types:
-            self.fields["messaging_provider"].queryset = queryset.filter(type__in=provider_types)
+            queryset = queryset.filter(type__in=provider_types)
         else:
             self.fields["messaging_provider"].widget = forms.HiddenInput()
+        self.fields["messaging_provider"].queryset = queryset
 
     def save(self, experiment, config_data: dict):
         self.instance.experiment = experiment
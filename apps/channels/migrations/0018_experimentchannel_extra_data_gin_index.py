@@ -0,0 +1,19 @@
+# Generated by Django 4.2.11 on 2026-10-15 16:45
+
+import django.contrib.postgres.indexes
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("channels", "0017_alter_experimentchannel_platform"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="experimentchannel",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["extra_data"], name="expchan_extra_gin", opclasses=["jsonb_path_ops"]
+            ),
+        ),
+    ]
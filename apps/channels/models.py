@@ -2,6 +2,7 @@ import logging
 import uuid
 
 from django.conf import settings
+from django.contrib.postgres.indexes import GinIndex
 from django.db import models
 from django.db.models import JSONField, Q
 from django.urls import reverse
@@ -79,7 +80,11 @@ class ChannelPlatform(models.TextChoices):
 class ExperimentChannelObjectManager(AuditingManager):
     def filter_extras(self, team_slug: str, platform: ChannelPlatform, key: str, value: str):
         extra_data_filter = Q(extra_data__contains={key: value})
-        return self.filter(extra_data_filter).filter(experiment__team__slug=team_slug, platform=platform)
+        return (
+            self.filter(extra_data_filter)
+            .filter(experiment__team__slug=team_slug, platform=platform)
+            .select_related("experiment", "experiment__team", "messaging_provider")
+        )
 
     def get_queryset(self):
         return super().get_queryset().filter(deleted=False)
@@ -109,6 +114,10 @@ class ExperimentChannel(BaseModel):
 
     class Meta:
         ordering = ["name"]
+        indexes = [
+            # supports the `extra_data__contains` lookups used to route inbound messages to a channel
+            GinIndex(fields=["extra_data"], name="expchan_extra_gin", opclasses=["jsonb_path_ops"]),
+        ]
 
     def __str__(self):
         return f"Channel: {self.name} ({self.platform})"
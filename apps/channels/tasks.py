@@ -1,7 +1,7 @@
-import json
 import logging
 import uuid
 
+import orjson
 from celery.app import shared_task
 from taskbadger.celery import Task as TaskbadgerTask
 from telebot import types
@@ -15,11 +15,22 @@ from apps.utils.taskbadger import update_taskbadger_data
 
 log = logging.getLogger(__name__)
 
+# relations touched by the channel handlers for every inbound message
+CHANNEL_RELATED_FIELDS = ("experiment", "experiment__team", "messaging_provider")
+
+# maps the platform of an inbound Twilio message to the `extra_data` key identifying the channel and its handler
+TWILIO_PLATFORM_CHANNELS = {
+    ChannelPlatform.WHATSAPP: ("number", WhatsappChannel),
+    ChannelPlatform.FACEBOOK: ("page_id", FacebookMessengerChannel),
+}
+
 
 @shared_task(bind=True, base=TaskbadgerTask)
 def handle_telegram_message(self, message_data: str, channel_external_id: uuid):
     experiment_channel = (
-        ExperimentChannel.objects.filter(external_id=channel_external_id).select_related("experiment").first()
+        ExperimentChannel.objects.filter(external_id=channel_external_id)
+        .select_related(*CHANNEL_RELATED_FIELDS)
+        .first()
     )
     if not experiment_channel:
         return
@@ -38,22 +49,21 @@ def handle_telegram_message(self, message_data: str, channel_external_id: uuid):
 
 @shared_task(bind=True, base=TaskbadgerTask)
 def handle_twilio_message(self, message_data: str, request_uri: str, signature: str):
-    raw_data = json.loads(message_data)
+    raw_data = orjson.loads(message_data)
     message = TwilioMessage.parse(raw_data)
 
-    channel_id_key = ""
-    ChannelClass = None
-    match message.platform:
-        case ChannelPlatform.WHATSAPP:
-            channel_id_key = "number"
-            ChannelClass = WhatsappChannel
-        case ChannelPlatform.FACEBOOK:
-            channel_id_key = "page_id"
-            ChannelClass = FacebookMessengerChannel
-
-    experiment_channel = ExperimentChannel.objects.filter(
-        extra_data__contains={channel_id_key: message.to}, messaging_provider__type=MessagingProviderType.twilio
-    ).first()
+    try:
+        channel_id_key, ChannelClass = TWILIO_PLATFORM_CHANNELS[message.platform]
+    except KeyError:
+        return
+
+    experiment_channel = (
+        ExperimentChannel.objects.filter(
+            extra_data__contains={channel_id_key: message.to}, messaging_provider__type=MessagingProviderType.twilio
+        )
+        .select_related(*CHANNEL_RELATED_FIELDS)
+        .first()
+    )
     if not experiment_channel:
         return
 
@@ -83,11 +93,15 @@ def validate_twillio_request(experiment_channel, raw_data, request_uri, signatur
 @shared_task(bind=True, base=TaskbadgerTask)
 def handle_turn_message(self, experiment_id: uuid, message_data: dict):
     message = TurnWhatsappMessage.parse(message_data)
-    experiment_channel = ExperimentChannel.objects.filter(
-        experiment__public_id=experiment_id,
-        platform=ChannelPlatform.WHATSAPP,
-        messaging_provider__type=MessagingProviderType.turnio,
-    ).first()
+    experiment_channel = (
+        ExperimentChannel.objects.filter(
+            experiment__public_id=experiment_id,
+            platform=ChannelPlatform.WHATSAPP,
+            messaging_provider__type=MessagingProviderType.turnio,
+        )
+        .select_related(*CHANNEL_RELATED_FIELDS)
+        .first()
+    )
     if not experiment_channel:
         return
     channel = WhatsappChannel(experiment_channel=experiment_channel)
@@ -1,5 +1,3 @@
-import json
-
 from telebot import types
 
 from apps.channels.datamodels import TelegramMessage
@@ -29,8 +27,7 @@ def text_message(chat_id: int = 123, message_text: str = "Hi there") -> Telegram
             "text": message_text,
         },
     }
-    json_data = json.dumps(message_data)
-    update = types.Update.de_json(json_data)
+    update = types.Update.de_json(message_data)
     return TelegramMessage.parse(update)
 
 
@@ -60,8 +57,7 @@ def photo_message(chat_id: int = 123) -> TelegramMessage:
             ],
         },
     }
-    json_data = json.dumps(message_data)
-    update = types.Update.de_json(json_data)
+    update = types.Update.de_json(message_data)
     return TelegramMessage.parse(update)
 
 
@@ -89,6 +85,5 @@ def audio_message(chat_id: int = 123) -> TelegramMessage:
             },
         },
     }
-    json_data = json.dumps(message_data)
-    update = types.Update.de_json(json_data)
+    update = types.Update.de_json(message_data)
     return TelegramMessage.parse(update)
@@ -7,25 +7,25 @@ from apps.users.models import CustomUser
 
 
 class TestExperimentChannelObjectManager(TestCase):
-    def setUp(self):
-        super().setUp()
-        self.telegram_chat_id = 1234567891
-        self.team = Team.objects.create(name="test-team")
-        self.user = CustomUser.objects.create_user(username="testuser")
-        self.experiment = Experiment.objects.create(
-            team=self.team,
-            owner=self.user,
+    @classmethod
+    def setUpTestData(cls):
+        cls.telegram_chat_id = 1234567891
+        cls.team = Team.objects.create(name="test-team")
+        cls.user = CustomUser.objects.create_user(username="testuser")
+        cls.experiment = Experiment.objects.create(
+            team=cls.team,
+            owner=cls.user,
             name="TestExperiment",
             description="test",
             prompt_text="You are a helpful assistant",
-            consent_form=ConsentForm.get_default(self.team),
+            consent_form=ConsentForm.get_default(cls.team),
         )
-        self.bot_token = "123123123"
-        self.bot_token_key = "bot_token"
-        self.experiment_channel = ExperimentChannel.objects.create(
+        cls.bot_token = "123123123"
+        cls.bot_token_key = "bot_token"
+        cls.experiment_channel = ExperimentChannel.objects.create(
             name="TestChannel",
-            experiment=self.experiment,
-            extra_data={self.bot_token_key: self.bot_token},
+            experiment=cls.experiment,
+            extra_data={cls.bot_token_key: cls.bot_token},
             platform=ChannelPlatform.TELEGRAM,
         )
 
@@ -6,10 +6,12 @@ intended. It utilizes the Telegram channel subclass to serve as a testing framew
 from unittest.mock import Mock, PropertyMock, patch
 
 import pytest
+from django.test import override_settings
 
 from apps.channels.models import ChannelPlatform, ExperimentChannel
-from apps.chat.channels import ChannelBase, TelegramChannel
+from apps.chat.channels import ChannelBase, TelegramChannel, _unsupported_message_bot_prompt
 from apps.chat.models import ChatMessageType
+from apps.events.models import StaticTriggerType
 from apps.experiments.models import ExperimentSession, Participant, SessionStatus, VoiceResponseBehaviours
 from apps.utils.factories.channels import ExperimentChannelFactory
 from apps.utils.factories.experiment import ExperimentFactory, ExperimentSessionFactory
@@ -214,13 +216,13 @@ def test_pre_conversation_flow(_get_llm_response, send_text_to_user_mock, genera
     assert pre_survey
 
     def _user_message(message: str):
-        message = telegram_messages.text_message(chat_id=telegram_chat_id, message_text=message)
-        channel.new_user_message(message)
+        channel.new_user_message(base_message.model_copy(update={"body": message}))
 
     experiment = channel.experiment
     experiment.seed_message = "Hi human"
     experiment.save()
     telegram_chat_id = "123"
+    base_message = telegram_messages.text_message(chat_id=telegram_chat_id)
 
     _user_message("Hi")
     chat = channel.experiment_session.chat
@@ -255,11 +257,31 @@ def test_pre_conversation_flow(_get_llm_response, send_text_to_user_mock, genera
     assert send_text_to_user_mock.call_args[0][0] == bot_response_to_seed_message
 
 
+@pytest.mark.django_db()
+@patch("apps.chat.channels.TelegramChannel.send_text_to_user", side_effect=Exception("Send failed"))
+@patch("apps.channels.models._set_telegram_webhook")
+def test_pre_conversation_history_saved_when_sending_fails(_set_telegram_webhook, send_text_to_user):
+    experiment = ExperimentFactory(conversational_consent_enabled=True)
+    channel = TelegramChannel(experiment_channel=ExperimentChannelFactory(experiment=experiment))
+
+    with pytest.raises(Exception, match="Send failed"):
+        channel.new_user_message(telegram_messages.text_message(message_text="Hi"))
+
+    session = channel.experiment_session
+    session.refresh_from_db()
+    assert session.status == SessionStatus.PENDING
+    assert list(session.chat.messages.values_list("message_type", flat=True)) == [
+        ChatMessageType.HUMAN,
+        ChatMessageType.AI,
+    ]
+
+
 @pytest.mark.django_db()
 @patch("apps.chat.channels.TelegramChannel.send_text_to_user")
 @patch("apps.chat.channels.TopicBot")
 @patch("apps.channels.models._set_telegram_webhook")
 def test_unsupported_message_type_creates_system_message(_set_telegram_webhook, topic_bot, send_text_to_user):
+    topic_bot.return_value.process_input.return_value = "Not supported"
     experiment = ExperimentFactory(conversational_consent_enabled=True)
     channel = TelegramChannel(experiment_channel=ExperimentChannelFactory(experiment=experiment))
     assert channel.experiment_session is None
@@ -523,3 +545,184 @@ def test_participant_reused_accross_experiments(_send_message_to_user, _get_llm_
     assert Participant.objects.filter(team=team2, identifier=chat_id).count() == 1
     # but 2 participants accross all teams with identifier = chat_id
     assert Participant.objects.filter(identifier=chat_id).count() == 2
+
+
+@override_settings(CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}})
+@pytest.mark.django_db()
+@patch("apps.chat.channels.TelegramChannel._transcribe_audio", return_value="Hello bot")
+@patch("apps.chat.channels.TelegramChannel.get_message_audio")
+def test_voice_transcript_is_cached_by_media_id(get_message_audio, _transcribe_audio, telegram_channel):
+    """Re-delivered voice notes should not be downloaded and transcribed a second time"""
+    for _ in range(2):
+        telegram_channel._add_message(telegram_messages.audio_message())
+        assert telegram_channel._get_voice_transcript() == "Hello bot"
+
+    assert get_message_audio.call_count == 1
+    assert _transcribe_audio.call_count == 1
+
+
+@pytest.mark.django_db()
+@patch("apps.chat.channels.TelegramChannel._transcribe_audio", return_value="Hello bot")
+@patch("apps.chat.channels.TelegramChannel.get_message_audio")
+def test_reset_check_does_not_transcribe_voice_messages(get_message_audio, _transcribe_audio, telegram_channel):
+    telegram_channel._add_message(telegram_messages.text_message())
+    telegram_channel._add_message(telegram_messages.audio_message())
+
+    assert not telegram_channel._is_reset_conversation_request()
+    assert _transcribe_audio.call_count == 0
+
+
+@pytest.mark.django_db()
+@patch("apps.chat.channels.TelegramChannel.send_text_to_user")
+@patch("apps.chat.channels.TelegramChannel._generate_response_for_user", side_effect=["Not supported", "Nope"])
+def test_unsupported_message_type_response_is_generated_each_time(
+    _generate_response_for_user, send_text_to_user, telegram_channel
+):
+    for _ in range(2):
+        telegram_channel.new_user_message(telegram_messages.photo_message())
+
+    assert [call.args[0] for call in send_text_to_user.call_args_list] == ["Not supported", "Nope"]
+
+
+@pytest.mark.django_db()
+@patch("apps.chat.channels.enqueue_static_triggers_batch")
+@patch("apps.chat.channels.TelegramChannel.send_text_to_user")
+@patch("apps.chat.channels.TelegramChannel._get_llm_response", return_value="Hi")
+def test_static_triggers_enqueued_on_commit(
+    _get_llm_response,
+    send_text_to_user,
+    enqueue_static_triggers_batch,
+    telegram_channel,
+    django_capture_on_commit_callbacks,
+):
+    with django_capture_on_commit_callbacks() as callbacks:
+        telegram_channel.new_user_message(telegram_messages.text_message())
+        assert not enqueue_static_triggers_batch.delay.called
+
+    for callback in callbacks:
+        callback()
+    session_id = telegram_channel.experiment_session.id
+    enqueue_static_triggers_batch.delay.assert_called_once_with(
+        session_id,
+        [
+            StaticTriggerType.CONVERSATION_START,
+            StaticTriggerType.PARTICIPANT_JOINED_EXPERIMENT,
+            StaticTriggerType.NEW_HUMAN_MESSAGE,
+        ],
+    )
+
+
+@pytest.mark.django_db()
+@patch("apps.chat.channels.enqueue_static_triggers_batch")
+@patch("apps.chat.channels.TelegramChannel.send_text_to_user", side_effect=Exception("Send failed"))
+@patch("apps.channels.models._set_telegram_webhook")
+def test_static_triggers_enqueued_when_handling_fails(
+    _set_telegram_webhook,
+    send_text_to_user,
+    enqueue_static_triggers_batch,
+    django_capture_on_commit_callbacks,
+):
+    experiment = ExperimentFactory(conversational_consent_enabled=True)
+    channel = TelegramChannel(experiment_channel=ExperimentChannelFactory(experiment=experiment))
+
+    with django_capture_on_commit_callbacks(execute=True), pytest.raises(Exception, match="Send failed"):
+        channel.new_user_message(telegram_messages.text_message())
+
+    enqueue_static_triggers_batch.delay.assert_called_once_with(
+        channel.experiment_session.id,
+        [StaticTriggerType.CONVERSATION_START, StaticTriggerType.PARTICIPANT_JOINED_EXPERIMENT],
+    )
+
+
+@pytest.mark.django_db()
+# outside of a transaction the triggers are enqueued straight away
+@patch("apps.chat.channels.transaction.on_commit", side_effect=lambda func: func())
+@patch("apps.chat.channels.enqueue_static_triggers_batch")
+@patch("apps.chat.channels.TelegramChannel.send_text_to_user", side_effect=Exception("Send failed"))
+@patch("apps.channels.models._set_telegram_webhook")
+def test_enqueue_failure_does_not_hide_the_original_error(
+    _set_telegram_webhook, send_text_to_user, enqueue_static_triggers_batch, on_commit
+):
+    enqueue_static_triggers_batch.delay.side_effect = Exception("Broker unavailable")
+    experiment = ExperimentFactory(conversational_consent_enabled=True)
+    channel = TelegramChannel(experiment_channel=ExperimentChannelFactory(experiment=experiment))
+
+    with pytest.raises(Exception, match="Send failed"):
+        channel.new_user_message(telegram_messages.text_message())
+    assert enqueue_static_triggers_batch.delay.called
+
+
+@pytest.mark.django_db()
+@patch("apps.chat.channels.enqueue_static_triggers_batch")
+def test_static_triggers_discarded_when_the_session_is_rolled_back(
+    enqueue_static_triggers_batch, telegram_channel, django_capture_on_commit_callbacks
+):
+    create_session = TelegramChannel._create_new_experiment_session
+
+    def _create_session_and_fail(channel):
+        create_session(channel)
+        raise Exception("Session setup failed")
+
+    with (
+        patch.object(
+            TelegramChannel, "_create_new_experiment_session", autospec=True, side_effect=_create_session_and_fail
+        ),
+        django_capture_on_commit_callbacks(execute=True),
+        pytest.raises(Exception, match="Session setup failed"),
+    ):
+        telegram_channel.new_user_message(telegram_messages.text_message())
+
+    enqueue_static_triggers_batch.delay.assert_not_called()
+    assert not ExperimentSession.objects.filter(experiment=telegram_channel.experiment).exists()
+
+
+@pytest.mark.django_db()
+@patch("apps.chat.channels.audio.convert_audio")
+@patch("apps.chat.channels.get_http_session")
+def test_telegram_audio_download_is_streamed(get_http_session, convert_audio, telegram_channel):
+    response = get_http_session.return_value.get.return_value.__enter__.return_value
+    response.iter_content.return_value = [b"voice ", b"note"]
+    telegram_channel.message = telegram_messages.audio_message()
+
+    telegram_channel.get_message_audio()
+
+    assert get_http_session.return_value.get.call_args.kwargs["stream"]
+    ogg_audio = convert_audio.call_args.args[0]
+    assert ogg_audio.read() == b"voice note"
+
+
+@pytest.mark.django_db()
+@patch("apps.chat.channels.TelegramChannel.send_voice_to_user")
+@patch("apps.service_providers.models.VoiceProvider.get_speech_service")
+def test_voice_synthesis_status_sent_during_synthesis(get_speech_service, send_voice_to_user, telegram_channel):
+    telegram_channel.message = telegram_messages.audio_message()
+    synthesize_voice = get_speech_service.return_value.synthesize_voice
+
+    telegram_channel._reply_voice_message("Hi there")
+
+    telegram_channel.telegram_bot.send_chat_action.assert_called_with(chat_id="123", action="record_voice")
+    synthesize_voice.assert_called_with("Hi there", telegram_channel.experiment.synthetic_voice)
+    send_voice_to_user.assert_called_with(synthesize_voice.return_value)
+
+
+@pytest.mark.django_db()
+@patch("apps.chat.channels.TelegramChannel.voice_synthesis_started")
+@patch("apps.chat.channels.TelegramChannel.send_voice_to_user")
+@patch("apps.service_providers.models.VoiceProvider.get_speech_service")
+@patch("apps.channels.models._set_telegram_webhook")
+def test_voice_synthesis_status_gets_the_chat_id_from_the_session(
+    _set_telegram_webhook, get_speech_service, send_voice_to_user, voice_synthesis_started
+):
+    """Bot messages (e.g. from timeouts) don't come with a user message so the chat ID is read from the session.
+    That loads the participant which must happen before the callback runs on the status thread."""
+    session = ExperimentSessionFactory(participant__identifier="456")
+    channel = ChannelBase.from_experiment_session(ExperimentSession.objects.get(id=session.id))
+
+    channel._reply_voice_message("Hi there")
+
+    voice_synthesis_started.assert_called_once_with("456")
+
+
+def test_unsupported_message_bot_prompt_lists_type_values():
+    prompt = _unsupported_message_bot_prompt(tuple(TelegramChannel.supported_message_types))
+    assert "You only support text, voice messages types" in prompt
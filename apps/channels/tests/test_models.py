@@ -56,7 +56,7 @@ def test_deleting_experiment_channel_only_removes_the_experiment_channel(db):
         experiment=experiment, experiment_channel=experiment_channel, participant__user=experiment.owner
     )
     experiment_session.chat = chat
-    experiment_session.save()
+    experiment_session.save(update_fields=["chat"])
 
     def _assert_not_deleted(instance):
         instance.refresh_from_db()
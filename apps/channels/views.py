@@ -1,6 +1,6 @@
-import json
 import uuid
 
+import orjson
 from django.conf import settings
 from django.http import HttpResponse, HttpResponseBadRequest
 from django.shortcuts import get_object_or_404
@@ -20,14 +20,14 @@ def new_telegram_message(request, channel_external_id: uuid):
     if token != settings.TELEGRAM_SECRET_TOKEN:
         return HttpResponseBadRequest("Invalid request.")
 
-    data = json.loads(request.body)
+    data = orjson.loads(request.body)
     tasks.handle_telegram_message.delay(message_data=data, channel_external_id=channel_external_id)
     return HttpResponse()
 
 
 @csrf_exempt
 def new_twilio_message(request):
-    message_data = json.dumps(request.POST.dict())
+    message_data = orjson.dumps(request.POST.dict()).decode()
     tasks.handle_twilio_message.delay(
         message_data=message_data,
         request_uri=request.build_absolute_uri(),
@@ -38,7 +38,7 @@ def new_twilio_message(request):
 
 @csrf_exempt
 def new_turn_message(request, experiment_id: uuid):
-    message_data = json.loads(request.body.decode("utf-8"))
+    message_data = orjson.loads(request.body)
     if "messages" not in message_data:
         # Normal inbound messages should have a "messages" key, so ignore everything else
         return HttpResponse()
@@ -180,6 +180,8 @@ class SafetyBot:
         return response
 
     def is_safe(self, input_str: str) -> bool:
+        # each message is reviewed on its own, even when the bot is reused for several messages
+        self.conversation.memory.clear()
         result = self._call_predict(input_str)
         if result.strip().lower().startswith("safe"):
             return True
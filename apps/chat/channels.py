@@ -1,11 +1,11 @@
 import logging
 from abc import abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
-from functools import cached_property
+from functools import cached_property, lru_cache
 from io import BytesIO
 from typing import ClassVar
 
-import requests
 from django.conf import settings
 from django.db import transaction
 from telebot import TeleBot
@@ -13,11 +13,12 @@ from telebot.util import antiflood, smart_split
 
 from apps.channels import audio
 from apps.channels.models import ChannelPlatform, ExperimentChannel
+from apps.chat import transcription_cache
 from apps.chat.bots import TopicBot
 from apps.chat.exceptions import AudioSynthesizeException, MessageHandlerException
 from apps.chat.models import ChatMessage, ChatMessageType
 from apps.events.models import StaticTriggerType
-from apps.events.tasks import enqueue_static_triggers
+from apps.events.tasks import enqueue_static_triggers_batch
 from apps.experiments.models import (
     Experiment,
     ExperimentSession,
@@ -29,8 +30,11 @@ from apps.service_providers.llm_service.runnables import GenerationCancelled
 from apps.service_providers.speech_service import SynthesizedAudio
 from apps.slack.utils import parse_session_external_id
 from apps.users.models import CustomUser
+from apps.utils.http import DEFAULT_TIMEOUT, get_http_session
 
 USER_CONSENT_TEXT = "1"
+AUDIO_DOWNLOAD_CHUNK_SIZE = 64 * 1024
+PRE_CONVERSATION_STATUSES = frozenset([SessionStatus.SETUP, SessionStatus.PENDING, SessionStatus.PENDING_PRE_SURVEY])
 UNSUPPORTED_MESSAGE_BOT_PROMPT = """
 Tell the user (in the language being spoken) that they sent an unsupported message.
 You only support {supported_types} messages types. Respond only with the message for the user
@@ -43,7 +47,10 @@ class MESSAGE_TYPES(Enum):
 
     @staticmethod
     def is_member(value: str):
-        return any(value == item.value for item in MESSAGE_TYPES)
+        return value in _MESSAGE_TYPE_VALUES
+
+
+_MESSAGE_TYPE_VALUES = frozenset(item.value for item in MESSAGE_TYPES)
 
 
 class ChannelBase:
@@ -53,6 +60,8 @@ class ChannelBase:
 
     Attributes:
         voice_replies_supported: Indicates whether the channel supports voice messages
+        is_external: Indicates whether the conversation happens on an external platform. External channels handle
+            session resets and the pre-conversation flow through the chat itself
 
     Args:
         experiment_channel: An optional ExperimentChannel object representing the channel associated with the handler.
@@ -83,6 +92,7 @@ class ChannelBase:
         transcription_started:A callback indicating that the transcription process has started
         transcription_finished: A callback indicating that the transcription process has finished.
         submit_input_to_llm: A callback indicating that the user input will be given to the language model
+        voice_synthesis_started: A callback indicating that the voice reply is being synthesized
     Public API:
         new_user_message: Handles a message coming from the user.
         new_bot_message: Handles a message coming from the bot.
@@ -91,6 +101,7 @@ class ChannelBase:
 
     voice_replies_supported: ClassVar[bool] = False
     supported_message_types: ClassVar[str] = []
+    is_external: ClassVar[bool] = True
 
     def __init__(
         self,
@@ -105,17 +116,20 @@ class ChannelBase:
         self.experiment = experiment_channel.experiment if experiment_channel else experiment_session.experiment
         self.message = None
         self._user_query = None
+        self._pending_triggers: list[StaticTriggerType] = []
+        self._topic_bot: TopicBot | None = None
         self.initialize()
 
     @abstractmethod
     def initialize(self):
         pass
 
-    @property
+    @cached_property
     def chat_id(self) -> str:
         if self.experiment_session and self.experiment_session.participant.identifier:
             return self.experiment_session.participant.identifier
-        return self.get_chat_id_from_message(self.message)
+        # participant identifiers are strings so make sure this is consistent regardless of where it comes from
+        return str(self.get_chat_id_from_message(self.message))
 
     @abstractmethod
     def get_chat_id_from_message(self, message):
@@ -163,6 +177,12 @@ class ChannelBase:
         """Callback indicating that the user input will now be given to the LLM"""
         pass
 
+    @abstractmethod
+    def voice_synthesis_started(self, chat_id: str):
+        """Callback indicating that the bot's reply is being synthesized. This runs on a separate thread while the
+        synthesis is in progress so it must not access the database, which is why the `chat_id` is passed in"""
+        pass
+
     def new_bot_message(self, bot_message: str):
         """Handles a message coming from the bot. Call this to send bot messages to the user"""
         self._send_message_to_user(bot_message)
@@ -172,20 +192,10 @@ class ChannelBase:
         """Given an `experiment_session` instance, returns the correct ChannelBase subclass to use"""
         platform = experiment_session.experiment_channel.platform
 
-        if platform == "telegram":
-            channel_cls = TelegramChannel
-        elif platform == "web":
-            channel_cls = WebChannel
-        elif platform == "whatsapp":
-            channel_cls = WhatsappChannel
-        elif platform == "facebook":
-            channel_cls = FacebookMessengerChannel
-        elif platform == "api":
-            channel_cls = ApiChannel
-        elif platform == "slack":
-            channel_cls = SlackChannel
-        else:
-            raise Exception(f"Unsupported platform type {platform}")
+        try:
+            channel_cls = PLATFORM_CHANNELS[platform]
+        except KeyError:
+            raise Exception(f"Unsupported platform type {platform}") from None
         return channel_cls(
             experiment_channel=experiment_session.experiment_channel, experiment_session=experiment_session
         )
@@ -202,25 +212,50 @@ class ChannelBase:
     def _add_message(self, message):
         """Adds the message to the handler in order to extract session information"""
         self._user_query = None
+        self._topic_bot = None
         self.message = message
+        self._clear_cached_message_properties()
         self._ensure_sessions_exists()
 
+    def _clear_cached_message_properties(self):
+        """The message properties are cached since they are read many times while handling a message. They need
+        to be cleared whenever the message or the session (which `chat_id` prefers) changes."""
+        for name in ("chat_id", "message_content_type", "message_text"):
+            self.__dict__.pop(name, None)
+
     def new_user_message(self, message) -> str:
         """Handles the message coming from the user. Call this to send bot messages to the user.
         The `message` here will probably be some object, depending on the channel being used.
         """
         try:
-            return self._new_user_message(message)
+            response = self._new_user_message(message)
         except GenerationCancelled:
-            return ""
+            response = ""
+        except Exception:
+            # the session was saved before handling the message failed so its triggers (e.g. CONVERSATION_START)
+            # should still fire, but failing to enqueue them must not hide the original error
+            try:
+                self._flush_static_triggers()
+            except Exception:
+                logging.exception("Unable to enqueue the static triggers for session %s", self.experiment_session.id)
+            raise
+        self._flush_static_triggers()
+        return response
 
     def _new_user_message(self, message) -> str:
-        self._add_message(message)
+        try:
+            with transaction.atomic():
+                # finding / creating the session can involve several writes, commit them together
+                self._add_message(message)
+        except Exception:
+            # the triggers were queued for changes that have been rolled back
+            self._pending_triggers = []
+            raise
 
         if not self.is_message_type_supported():
             return self._handle_unsupported_message()
 
-        if self.experiment_channel.platform != ChannelPlatform.WEB:
+        if self.is_external:
             if self._is_reset_conversation_request():
                 # Webchats' statuses are updated through an "external" flow
                 return
@@ -234,7 +269,9 @@ class ChannelBase:
                 # is ACTIVE
                 self.experiment_session.update_status(SessionStatus.ACTIVE)
 
-        enqueue_static_triggers.delay(self.experiment_session.id, StaticTriggerType.NEW_HUMAN_MESSAGE)
+        self._enqueue_static_trigger(StaticTriggerType.NEW_HUMAN_MESSAGE)
+        # the triggers should fire before the (potentially slow) response is generated
+        self._flush_static_triggers()
         response = self._handle_supported_message()
         return response
 
@@ -252,13 +289,12 @@ class ChannelBase:
         (Status==PENDING_PRE_SURVEY) user indicated that they took the survey -> sett status to ACTIVE
         """
         # We manually add the message to the history here, since this doesn't follow the normal flow
-        self._add_message_to_history(self.user_query, ChatMessageType.HUMAN)
-
         if self.experiment_session.status == SessionStatus.SETUP:
             self._chat_initiated()
         elif self.experiment_session.status == SessionStatus.PENDING:
             if self._user_gave_consent():
                 if not self.experiment.pre_survey:
+                    self._add_message_to_history(self.user_query, ChatMessageType.HUMAN)
                     self.start_conversation()
                 else:
                     self.experiment_session.update_status(SessionStatus.PENDING_PRE_SURVEY)
@@ -267,6 +303,7 @@ class ChannelBase:
                 self._ask_user_for_consent()
         elif self.experiment_session.status == SessionStatus.PENDING_PRE_SURVEY:
             if self._user_gave_consent():
+                self._add_message_to_history(self.user_query, ChatMessageType.HUMAN)
                 self.start_conversation()
             else:
                 self._ask_user_to_take_survey()
@@ -287,14 +324,23 @@ class ChannelBase:
         consent_text = self.experiment.consent_form.consent_text
         confirmation_text = self.experiment.consent_form.confirmation_text
         bot_message = f"{consent_text}\n\n{confirmation_text}"
-        self._add_message_to_history(bot_message, ChatMessageType.AI)
-        self.send_text_to_user(bot_message)
+        self._reply_to_pre_conversation_message(bot_message)
 
     def _ask_user_to_take_survey(self):
         pre_survey_link = self.experiment_session.get_pre_survey_link()
         confirmation_text = self.experiment.pre_survey.confirmation_text
         bot_message = confirmation_text.format(survey_link=pre_survey_link)
-        self._add_message_to_history(bot_message, ChatMessageType.AI)
+        self._reply_to_pre_conversation_message(bot_message)
+
+    def _reply_to_pre_conversation_message(self, bot_message: str):
+        """Saves the user's message and the bot's reply with a single insert before sending the reply"""
+        chat = self.experiment_session.chat
+        ChatMessage.objects.bulk_create(
+            [
+                ChatMessage(chat=chat, message_type=ChatMessageType.HUMAN, content=self.user_query),
+                ChatMessage(chat=chat, message_type=ChatMessageType.AI, content=bot_message),
+            ]
+        )
         self.send_text_to_user(bot_message)
 
     def _should_handle_pre_conversation_requirements(self):
@@ -302,11 +348,7 @@ class ChannelBase:
         out the survey. Since we're using and updating the session's status during this flow, simply checking the
         session status should be enough.
         """
-        return self.experiment_session.status in [
-            SessionStatus.SETUP,
-            SessionStatus.PENDING,
-            SessionStatus.PENDING_PRE_SURVEY,
-        ]
+        return self.experiment_session.status in PRE_CONVERSATION_STATUSES
 
     def _user_gave_consent(self) -> bool:
         return self.user_query.strip() == USER_CONSENT_TEXT
@@ -347,8 +389,15 @@ class ChannelBase:
     def _reply_voice_message(self, text: str):
         voice_provider = self.experiment.voice_provider
         speech_service = voice_provider.get_speech_service()
+        synthetic_voice = self.experiment.synthetic_voice
         try:
-            synthetic_voice_audio = speech_service.synthesize_voice(text, self.experiment.synthetic_voice)
+            # let the user know what's happening while the synthesis runs instead of before it
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                # `chat_id` may need to load the participant so resolve it on this thread
+                status_update = executor.submit(self.voice_synthesis_started, self.chat_id)
+                synthetic_voice_audio = speech_service.synthesize_voice(text, synthetic_voice)
+            if status_update.exception():
+                logging.warning("Unable to send the voice synthesis status: %s", status_update.exception())
             self.send_voice_to_user(synthetic_voice_audio)
         except AudioSynthesizeException as e:
             logging.exception(e)
@@ -358,11 +407,25 @@ class ChannelBase:
         # Indicate to the user that the bot is busy processing the message
         self.transcription_started()
 
-        audio_file = self.get_message_audio()
-        transcript = self._transcribe_audio(audio_file)
+        if media_id := self._get_message_media_id():
+            # look up the transcript before downloading the audio
+            transcript = transcription_cache.get_or_transcribe(
+                self.experiment, media_id, lambda: self._transcribe_audio(self.get_message_audio())
+            )
+        else:
+            audio_file = self.get_message_audio()
+            transcript = transcription_cache.get_or_transcribe(
+                self.experiment,
+                transcription_cache.audio_digest(audio_file),
+                lambda: self._transcribe_audio(audio_file),
+            )
         self.transcription_finished(transcript)
         return transcript
 
+    def _get_message_media_id(self) -> str | None:
+        """Returns an identifier for the message's media, if the channel provides one"""
+        return getattr(self.message, "media_id", None) or getattr(self.message, "media_url", None)
+
     def _transcribe_audio(self, audio: BytesIO) -> str:
         llm_service = self.experiment.get_llm_service()
         if llm_service.supports_transcription:
@@ -381,10 +444,9 @@ class ChannelBase:
         return self._get_experiment_response(message=text)
 
     def _get_experiment_response(self, message: str) -> str:
-        experiment_bot = TopicBot(self.experiment_session)
-        answer = experiment_bot.process_input(message)
+        answer = self._get_topic_bot().process_input(message)
         self.experiment_session.no_activity_ping_count = 0
-        self.experiment_session.save()
+        self.experiment_session.save(update_fields=["no_activity_ping_count"])
         return answer
 
     def _add_message_to_history(self, message: str, message_type: ChatMessageType):
@@ -406,17 +468,27 @@ class ChannelBase:
         session.
         """
         self.experiment_session = (
-            ExperimentSession.objects.filter(
+            # the session's experiment is what the bots run so include the relations they read
+            ExperimentSession.objects.select_related(
+                "participant__user",
+                "chat",
+                "experiment_channel",
+                "experiment__llm_provider",
+                "experiment__source_material",
+                "experiment__assistant",
+            )
+            .filter(
                 experiment=self.experiment,
-                participant__identifier=str(self.chat_id),
+                participant__identifier=self.chat_id,
             )
             .order_by("-created_at")
             .first()
         )
+        self._clear_cached_message_properties()
 
         if not self.experiment_session:
             self._create_new_experiment_session()
-            enqueue_static_triggers.delay(self.experiment_session.id, StaticTriggerType.PARTICIPANT_JOINED_EXPERIMENT)
+            self._enqueue_static_trigger(StaticTriggerType.PARTICIPANT_JOINED_EXPERIMENT)
         else:
             if self._is_reset_conversation_request() and self.experiment_session.user_already_engaged():
                 self._reset_session()
@@ -430,7 +502,7 @@ class ChannelBase:
                 # migration (apps/channels/migrations/0005_create_channel_sessions.py) to link experiment channels
                 # to the channel sessions when removing this code
                 self.experiment_session.experiment_channel = self.experiment_channel
-                self.experiment_session.save()
+                self.experiment_session.save(update_fields=["experiment_channel"])
 
     def _reset_session(self):
         """Resets the session by ending the current `experiment_session` and creating a new one"""
@@ -452,10 +524,26 @@ class ChannelBase:
             llm=self.experiment.llm,
             experiment_channel=self.experiment_channel,
         )
-        enqueue_static_triggers.delay(self.experiment_session.id, StaticTriggerType.CONVERSATION_START)
+        self._clear_cached_message_properties()
+        self._enqueue_static_trigger(StaticTriggerType.CONVERSATION_START)
+
+    def _enqueue_static_trigger(self, trigger_type: StaticTriggerType):
+        """Queues the trigger for the current session. Call `_flush_static_triggers` to enqueue the queued triggers"""
+        self._pending_triggers.append(trigger_type)
+
+    def _flush_static_triggers(self):
+        """Enqueues all queued triggers as a single task once the current transaction (if any) commits so that the
+        task sees the changes"""
+        if not self._pending_triggers:
+            return
+        session_id, trigger_types = self.experiment_session.id, self._pending_triggers
+        self._pending_triggers = []
+        transaction.on_commit(lambda: enqueue_static_triggers_batch.delay(session_id, trigger_types))
 
     def _is_reset_conversation_request(self):
-        return self.user_query == ExperimentChannel.RESET_COMMAND
+        # The reset command is only ever sent as text. Checking the raw text instead of `user_query` avoids
+        # transcribing voice messages while the session is being looked up.
+        return self.message_content_type == MESSAGE_TYPES.TEXT and self.message_text == ExperimentChannel.RESET_COMMAND
 
     def is_message_type_supported(self) -> bool:
         return self.message_content_type is not None and self.message_content_type in self.supported_message_types
@@ -467,9 +555,7 @@ class ChannelBase:
             message_type=ChatMessageType.SYSTEM,
             content=f"The user sent an unsupported message type: {self.message.content_type_unparsed}",
         )
-        return self._generate_response_for_user(
-            UNSUPPORTED_MESSAGE_BOT_PROMPT.format(supported_types=self.supported_message_types)
-        )
+        return self._generate_response_for_user(_unsupported_message_bot_prompt(tuple(self.supported_message_types)))
 
     def _inform_user_of_error(self):
         """Simply tells the user that something went wrong to keep them in the loop"""
@@ -483,8 +569,14 @@ class ChannelBase:
 
     def _generate_response_for_user(self, prompt: str) -> str:
         """Generates a response based on the `prompt`."""
-        topic_bot = TopicBot(self.experiment_session)
-        return topic_bot.process_input(user_input=prompt, save_input_to_history=False)
+        return self._get_topic_bot().process_input(user_input=prompt, save_input_to_history=False)
+
+    def _get_topic_bot(self) -> TopicBot:
+        """Returns the bot for the current session. Setting up the bot is fairly expensive so it is shared by all
+        the responses generated while handling a message."""
+        if self._topic_bot is None or self._topic_bot.session != self.experiment_session:
+            self._topic_bot = TopicBot(self.experiment_session)
+        return self._topic_bot
 
 
 class WebChannel(ChannelBase):
@@ -492,15 +584,16 @@ class WebChannel(ChannelBase):
 
     voice_replies_supported = False
     supported_message_types = [MESSAGE_TYPES.TEXT]
+    is_external = False
 
     def get_chat_id_from_message(self, message):
         return message.chat_id
 
-    @property
+    @cached_property
     def message_content_type(self):
         return MESSAGE_TYPES.TEXT
 
-    @property
+    @cached_property
     def message_text(self):
         return self.message.message_text
 
@@ -508,6 +601,10 @@ class WebChannel(ChannelBase):
         # Simply adding a new AI message to the chat history will cause it to be sent to the UI
         pass
 
+    def _send_message_to_user(self, bot_message: str):
+        # The UI gets the response from the chat history so there's nothing to send
+        pass
+
     def _ensure_sessions_exists(self):
         if not self.experiment_session:
             raise MessageHandlerException("WebChannel requires an existing session")
@@ -549,11 +646,11 @@ class TelegramChannel(ChannelBase):
     def get_chat_id_from_message(self, message):
         return message.chat_id
 
-    @property
+    @cached_property
     def message_content_type(self):
         return self.message.content_type
 
-    @property
+    @cached_property
     def message_text(self):
         return self.message.body
 
@@ -563,12 +660,20 @@ class TelegramChannel(ChannelBase):
         )
 
     def send_text_to_user(self, text: str):
+        # The chunks are sent one after the other since Telegram shows messages in the order they were received.
+        # TeleBot already reuses a keep-alive session per thread for these calls.
+        chat_id = self.chat_id
         for message_text in smart_split(text):
-            antiflood(self.telegram_bot.send_message, self.chat_id, text=message_text)
+            antiflood(self.telegram_bot.send_message, chat_id, text=message_text)
 
     def get_message_audio(self) -> BytesIO:
         file_url = self.telegram_bot.get_file_url(self.message.media_id)
-        ogg_audio = BytesIO(requests.get(file_url).content)
+        # stream the download into the buffer instead of holding the full response body alongside it
+        ogg_audio = BytesIO()
+        with get_http_session().get(file_url, stream=True, timeout=DEFAULT_TIMEOUT) as response:
+            for chunk in response.iter_content(chunk_size=AUDIO_DOWNLOAD_CHUNK_SIZE):
+                ogg_audio.write(chunk)
+        ogg_audio.seek(0)
         return audio.convert_audio(ogg_audio, target_format="wav", source_format="ogg")
 
     # Callbacks
@@ -580,6 +685,9 @@ class TelegramChannel(ChannelBase):
     def transcription_started(self):
         self.telegram_bot.send_chat_action(chat_id=self.chat_id, action="upload_voice")
 
+    def voice_synthesis_started(self, chat_id: str):
+        self.telegram_bot.send_chat_action(chat_id=chat_id, action="record_voice")
+
     def transcription_finished(self, transcript: str):
         self.telegram_bot.send_message(
             self.chat_id, text=f"I heard: {transcript}", reply_to_message_id=self.message.message_id
@@ -609,11 +717,11 @@ class WhatsappChannel(ChannelBase):
     def supported_message_types(self):
         return self.messaging_service.supported_message_types
 
-    @property
+    @cached_property
     def message_content_type(self):
         return self.message.content_type
 
-    @property
+    @cached_property
     def message_text(self):
         return self.message.message_text
 
@@ -653,11 +761,11 @@ class FacebookMessengerChannel(ChannelBase):
     def supported_message_types(self):
         return self.messaging_service.supported_message_types
 
-    @property
+    @cached_property
     def message_content_type(self):
         return self.message.content_type
 
-    @property
+    @cached_property
     def message_text(self):
         return self.message.message_text
 
@@ -686,11 +794,11 @@ class ApiChannel(ChannelBase):
     def get_chat_id_from_message(self, message):
         return message.chat_id
 
-    @property
+    @cached_property
     def message_content_type(self):
         return MESSAGE_TYPES.TEXT
 
-    @property
+    @cached_property
     def message_text(self):
         return self.message.message_text
 
@@ -722,11 +830,11 @@ class SlackChannel(ChannelBase):
     def messaging_service(self):
         return self.experiment_channel.messaging_provider.get_messaging_service()
 
-    @property
+    @cached_property
     def message_content_type(self):
         return MESSAGE_TYPES.TEXT
 
-    @property
+    @cached_property
     def message_text(self):
         return self.message.message_text
 
@@ -761,6 +869,24 @@ class SlackChannel(ChannelBase):
         )
 
 
+@lru_cache
+def _unsupported_message_bot_prompt(supported_types: tuple[MESSAGE_TYPES, ...]) -> str:
+    """The prompt only depends on the channel's supported message types so it is only formatted once per channel
+    type. Some channels get their supported types from the messaging service, so this can't be a class attribute.
+    """
+    return UNSUPPORTED_MESSAGE_BOT_PROMPT.format(supported_types=", ".join(type_.value for type_ in supported_types))
+
+
+PLATFORM_CHANNELS = {
+    ChannelPlatform.TELEGRAM: TelegramChannel,
+    ChannelPlatform.WEB: WebChannel,
+    ChannelPlatform.WHATSAPP: WhatsappChannel,
+    ChannelPlatform.FACEBOOK: FacebookMessengerChannel,
+    ChannelPlatform.API: ApiChannel,
+    ChannelPlatform.SLACK: SlackChannel,
+}
+
+
 def _start_experiment_session(
     experiment: Experiment,
     experiment_channel: ExperimentChannel,
@@ -777,20 +903,17 @@ def _start_experiment_session(
         # This should technically never happen, since we disable the input for logged in users
         raise Exception(f"User {participant_user.email} cannot impersonate participant {participant_identifier}")
 
-    with transaction.atomic():
-        try:
-            participant = Participant.objects.get(team=experiment.team, identifier=participant_identifier)
-            if participant_user and participant.user is None:
-                # If a participant becomes a user, we must reconcile the user and participant
-                participant.user = participant_user
-                participant.save()
-        except Participant.DoesNotExist:
-            participant = Participant.objects.create(
-                user=participant_user,
-                identifier=participant_identifier,
-                team=experiment.team,
-            )
+    # get_or_create protects the insert with its own savepoint so the lookup doesn't need to be in a transaction
+    participant, participant_created = Participant.objects.get_or_create(
+        team=experiment.team, identifier=participant_identifier, defaults={"user": participant_user}
+    )
+    if participant_user and participant.user is None:
+        # If a participant becomes a user, we must reconcile the user and participant
+        participant.user = participant_user
+        participant.save(update_fields=["user"])
 
+    with transaction.atomic():
+        # the session's chat is created along with the session
         session = ExperimentSession.objects.create(
             team=experiment.team,
             experiment=experiment,
@@ -801,11 +924,13 @@ def _start_experiment_session(
             external_id=session_external_id,
         )
 
-        # Record the participant's timezone
-        if timezone:
-            participant.update_memory(data={"timezone": timezone})
+    # Record the participant's timezone
+    if timezone:
+        participant.update_memory(data={"timezone": timezone})
 
-    if participant.experimentsession_set.count() == 1:
-        enqueue_static_triggers.delay(session.id, StaticTriggerType.PARTICIPANT_JOINED_EXPERIMENT)
-    enqueue_static_triggers.delay(session.id, StaticTriggerType.CONVERSATION_START)
+    trigger_types = [StaticTriggerType.CONVERSATION_START]
+    # a new participant can't have any other sessions so there's no need to check
+    if participant_created or not participant.experimentsession_set.exclude(id=session.id).exists():
+        trigger_types.insert(0, StaticTriggerType.PARTICIPANT_JOINED_EXPERIMENT)
+    enqueue_static_triggers_batch.delay(session.id, trigger_types)
     return session
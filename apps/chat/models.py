@@ -38,10 +38,12 @@ class Chat(BaseTeamModel, TaggedModelMixin, UserCommentsMixin):
 
     def get_langchain_messages_until_summary(self) -> list[BaseMessage]:
         messages = []
-        for message in self.messages.order_by("-created_at").iterator(100):
-            messages.append(message.to_langchain_dict())
-            if message.summary:
-                messages.append(message.summary_to_langchain_dict())
+        # only the columns needed to build the langchain messages are fetched, skipping model instantiation
+        rows = self.messages.order_by("-created_at").values_list("id", "content", "message_type", "summary")
+        for message_id, content, message_type, summary in rows.iterator(100):
+            messages.append(ChatMessage.get_langchain_dict(message_id, content, message_type))
+            if summary:
+                messages.append(ChatMessage.get_langchain_dict(message_id, summary, ChatMessageType.SYSTEM))
                 break
 
         return messages_from_dict(list(reversed(messages)))
@@ -90,21 +92,22 @@ class ChatMessage(BaseModel, TaggedModelMixin, UserCommentsMixin):
         return quote(self.created_at.isoformat())
 
     def to_langchain_dict(self) -> dict:
-        return self._get_langchain_dict(self.content, self.message_type)
+        return self.get_langchain_dict(self.id, self.content, self.message_type)
 
     def to_langchain_message(self) -> BaseMessage:
         return messages_from_dict([self.to_langchain_dict()])[0]
 
     def summary_to_langchain_dict(self) -> dict:
-        return self._get_langchain_dict(self.summary, ChatMessageType.SYSTEM)
+        return self.get_langchain_dict(self.id, self.summary, ChatMessageType.SYSTEM)
 
-    def _get_langchain_dict(self, content, message_type):
+    @staticmethod
+    def get_langchain_dict(message_id, content, message_type) -> dict:
         return {
             "type": message_type,
             "data": {
                 "content": content,
                 "additional_kwargs": {
-                    "id": self.id,
+                    "id": message_id,
                 },
             },
         }
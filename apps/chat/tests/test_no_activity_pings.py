@@ -62,7 +62,7 @@ def test_matches_session(session):
 )
 def test_status_filtering(status, matches, session):
     session.status = status
-    session.save()
+    session.save(update_fields=["status"])
     with freeze_time("2022-01-01") as frozen_time:
         _create_matching_chat(session, frozen_time)
         frozen_time.tick(delta=timedelta(minutes=2))
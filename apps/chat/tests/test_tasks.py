@@ -15,36 +15,36 @@ from apps.utils.langchain import mock_experiment_llm
 
 
 class TasksTest(TestCase):
-    def setUp(self):
-        super().setUp()
-        self.telegram_chat_id = 1234567891
-        self.team = Team.objects.create(name="test-team")
-        self.user = CustomUser.objects.create_user(username="testuser")
-        self.no_activity_config = NoActivityMessageConfig.objects.create(
-            team=self.team, message_for_bot="Some message", name="Some name", max_pings=3, ping_after=1
+    @classmethod
+    def setUpTestData(cls):
+        cls.telegram_chat_id = 1234567891
+        cls.team = Team.objects.create(name="test-team")
+        cls.user = CustomUser.objects.create_user(username="testuser")
+        cls.no_activity_config = NoActivityMessageConfig.objects.create(
+            team=cls.team, message_for_bot="Some message", name="Some name", max_pings=3, ping_after=1
         )
-        self.experiment = Experiment.objects.create(
-            team=self.team,
-            owner=self.user,
+        cls.experiment = Experiment.objects.create(
+            team=cls.team,
+            owner=cls.user,
             name="TestExperiment",
             description="test",
             prompt_text="You are a helpful assistant",
-            no_activity_config=self.no_activity_config,
-            consent_form=ConsentForm.get_default(self.team),
+            no_activity_config=cls.no_activity_config,
+            consent_form=ConsentForm.get_default(cls.team),
             llm_provider=LlmProvider.objects.create(
                 name="test",
                 type="openai",
-                team=self.team,
+                team=cls.team,
                 config={
                     "openai_api_key": "123123123",
                 },
             ),
             llm="gpt-4",
         )
-        self.experiment_channel = ExperimentChannel.objects.create(
-            name="TestChannel", experiment=self.experiment, extra_data={"bot_token": "123123123"}, platform="telegram"
+        cls.experiment_channel = ExperimentChannel.objects.create(
+            name="TestChannel", experiment=cls.experiment, extra_data={"bot_token": "123123123"}, platform="telegram"
         )
-        self.experiment_session = self._add_session(self.experiment)
+        cls.experiment_session = cls._add_session(cls.experiment)
 
     def test_getting_ping_message_saves_history(self):
         expected_ping_message = "Hey, answer me!"
@@ -57,11 +57,12 @@ class TasksTest(TestCase):
         assert response == expected_ping_message
         assert messages[0].content == expected_ping_message
 
-    def _add_session(self, experiment: Experiment, session_status: SessionStatus = SessionStatus.ACTIVE):
+    @classmethod
+    def _add_session(cls, experiment: Experiment, session_status: SessionStatus = SessionStatus.ACTIVE):
         return _start_experiment_session(
             experiment,
-            experiment_channel=self.experiment_channel,
-            participant_identifier=self.telegram_chat_id,
+            experiment_channel=cls.experiment_channel,
+            participant_identifier=cls.telegram_chat_id,
             session_status=session_status,
         )
 
@@ -0,0 +1,28 @@
+import hashlib
+from collections.abc import Callable
+from io import BytesIO
+
+from django.core.cache import cache
+
+# Transcripts contain participant data so only keep them long enough to cover re-deliveries of the same message
+TRANSCRIPT_CACHE_TIMEOUT = 60 * 60
+
+
+def audio_digest(audio: BytesIO) -> str:
+    """Content hash used to identify audio that didn't come with a media ID"""
+    return hashlib.blake2b(audio.getbuffer(), digest_size=16).hexdigest()
+
+
+def get_or_transcribe(experiment, media_key: str, transcribe: Callable[[], str]) -> str:
+    """Returns the cached transcript for `media_key`, calling `transcribe` and caching its result on a miss.
+
+    Re-delivered or forwarded voice notes share the same media key so they are only transcribed once.
+    """
+    cache_key = f"stt:{experiment.id}:{experiment.voice_provider_id}:{media_key}"
+    if transcript := cache.get(cache_key):
+        return transcript
+
+    transcript = transcribe()
+    if transcript:
+        cache.set(cache_key, transcript, TRANSCRIPT_CACHE_TIMEOUT)
+    return transcript
@@ -1,9 +1,17 @@
 import pytest
+from django.test import override_settings
 
 from apps.utils.factories.experiment import ExperimentFactory
 from apps.utils.factories.team import TeamWithUsersFactory
 
 
+@pytest.fixture(scope="session", autouse=True)
+def _fast_password_hasher():
+    """The default hasher is deliberately slow which adds up when creating users in tests"""
+    with override_settings(PASSWORD_HASHERS=["django.contrib.auth.hashers.MD5PasswordHasher"]):
+        yield
+
+
 @pytest.fixture()
 def team_with_users(db):
     return TeamWithUsersFactory.create()
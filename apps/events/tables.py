@@ -1,38 +1,22 @@
+from functools import lru_cache
+
 import django_tables2 as tables
 from django.conf import settings
 from django.template.loader import get_template
-from django.urls import reverse
+from django.urls import get_script_prefix, reverse
 
 from apps.events.models import EventActionType, StaticTriggerType
 from apps.utils.time import seconds_to_human
 
+STATIC_TRIGGER_LABELS = dict(StaticTriggerType.choices)
+EVENT_ACTION_LABELS = dict(EventActionType.choices)
+
 
 class ActionsColumn(tables.Column):
     def render(self, value, record):
         trigger_type = "timeout" if record["type"] == "__timeout__" else "static"
-        view_log_url = reverse(
-            f"experiments:events:{trigger_type}_logs_view",
-            kwargs={
-                "trigger_id": record["id"],
-                "experiment_id": record["experiment_id"],
-                "team_slug": record["team_slug"],
-            },
-        )
-        edit_url = reverse(
-            f"experiments:events:{trigger_type}_event_edit",
-            kwargs={
-                "trigger_id": record["id"],
-                "experiment_id": record["experiment_id"],
-                "team_slug": record["team_slug"],
-            },
-        )
-        delete_url = reverse(
-            f"experiments:events:{trigger_type}_event_delete",
-            kwargs={
-                "trigger_id": record["id"],
-                "experiment_id": record["experiment_id"],
-                "team_slug": record["team_slug"],
-            },
+        view_log_url, edit_url, delete_url = _get_action_urls(
+            trigger_type, record["id"], record["experiment_id"], record["team_slug"], get_script_prefix()
         )
         return get_template("events/events_actions_column_buttons.html").render(
             {
@@ -43,10 +27,22 @@ class ActionsColumn(tables.Column):
         )
 
 
+@lru_cache(maxsize=256)
+def _get_action_urls(trigger_type, trigger_id, experiment_id, team_slug, script_prefix) -> tuple[str, str, str]:
+    """The URLs only depend on the arguments so they can be cached across renders. `script_prefix` is part of the
+    cache key since `reverse` includes it in the URLs."""
+    kwargs = {"trigger_id": trigger_id, "experiment_id": experiment_id, "team_slug": team_slug}
+    return (
+        reverse(f"experiments:events:{trigger_type}_logs_view", kwargs=kwargs),
+        reverse(f"experiments:events:{trigger_type}_event_edit", kwargs=kwargs),
+        reverse(f"experiments:events:{trigger_type}_event_delete", kwargs=kwargs),
+    )
+
+
 class EventsTable(tables.Table):
     type = tables.Column(accessor="type", verbose_name="When...")
     action_type = tables.Column(accessor="action__action_type", verbose_name="Then...")
-    action_params = tables.JSONColumn(accessor="action__action_params", verbose_name="With these parameters...")
+    action_params = tables.JSONColumn(accessor="action__params", verbose_name="With these parameters...")
     total_num_triggers = tables.Column(accessor="total_num_triggers", verbose_name="Repeat")
     error_count = tables.Column(accessor="failure_count", verbose_name="Error Count")
     actions = ActionsColumn(empty_values=())
@@ -55,10 +51,10 @@ class EventsTable(tables.Table):
         if value == "__timeout__":
             return f"No response for {seconds_to_human(record['delay'])}"
         else:
-            return StaticTriggerType(value).label
+            return STATIC_TRIGGER_LABELS[value]
 
     def render_action_type(self, value):
-        return EventActionType(value).label
+        return EVENT_ACTION_LABELS[value]
 
     def render_total_num_triggers(self, value):
         return f"{value} times"
@@ -1,4 +1,5 @@
 import logging
+from collections import defaultdict
 
 from celery.app import shared_task
 from django.db.models import functions
@@ -20,6 +21,22 @@ def enqueue_static_triggers(session_id, trigger_type):
         fire_static_trigger.delay(trigger_id, session_id)
 
 
+@shared_task
+def enqueue_static_triggers_batch(session_id, trigger_types: list[str]):
+    """Same as `enqueue_static_triggers` for several trigger types at once. The triggers are fired in the order
+    of `trigger_types`."""
+    session = ExperimentSession.objects.get(id=session_id)
+
+    trigger_ids_by_type = defaultdict(list)
+    triggers = StaticTrigger.objects.filter(experiment_id=session.experiment_id, type__in=trigger_types)
+    for trigger_id, trigger_type in triggers.values_list("id", "type"):
+        trigger_ids_by_type[trigger_type].append(trigger_id)
+
+    for trigger_type in trigger_types:
+        for trigger_id in trigger_ids_by_type[trigger_type]:
+            fire_static_trigger.delay(trigger_id, session_id)
+
+
 @shared_task
 def fire_static_trigger(trigger_id, session_id):
     trigger = StaticTrigger.objects.get(id=trigger_id)
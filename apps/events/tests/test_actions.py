@@ -31,14 +31,13 @@ def pipeline():
 def test_end_conversation_runs_pipeline(session, pipeline):
     input = "Does anything get lost going through the pipe?"
     chat = Chat.objects.create(team=session.team)
-    message = ChatMessage.objects.create(
+    ChatMessage.objects.create(
         chat=chat,
         content=input,
         message_type=ChatMessageType.HUMAN,
     )
-    message.save()
     session.chat = chat
-    session.save()
+    session.save(update_fields=["chat"])
     static_trigger = StaticTrigger.objects.create(
         experiment=session.experiment,
         action=EventAction.objects.create(
@@ -13,6 +13,7 @@ from apps.events.models import (
     StaticTriggerType,
     TimeoutTrigger,
 )
+from apps.events.tasks import enqueue_static_triggers_batch
 from apps.utils.factories.experiment import (
     ExperimentSessionFactory,
 )
@@ -50,7 +51,7 @@ def test_last_timeout_can_end_conversation(session):
     message.created_at = fifteen_minutes_ago
     message.save()
     session.chat = chat
-    session.save()
+    session.save(update_fields=["chat"])
 
     timeout_trigger = TimeoutTrigger.objects.create(
         experiment=session.experiment,
@@ -74,3 +75,28 @@ def test_last_timeout_can_end_conversation(session):
     session.refresh_from_db()
     assert session.ended_at is not None
     assert static_trigger.event_logs.count() == 1
+
+
+@override_settings(CELERY_TASK_ALWAYS_EAGER=True)
+@mock.patch("apps.events.tasks.fire_static_trigger.run")
+@pytest.mark.django_db()
+def test_enqueue_static_triggers_batch(mock_fire_trigger, session):
+    def _create_trigger(trigger_type):
+        return StaticTrigger.objects.create(
+            experiment=session.experiment,
+            action=EventAction.objects.create(action_type=EventActionType.LOG),
+            type=trigger_type,
+        )
+
+    new_message_trigger = _create_trigger(StaticTriggerType.NEW_HUMAN_MESSAGE)
+    start_trigger = _create_trigger(StaticTriggerType.CONVERSATION_START)
+    _create_trigger(StaticTriggerType.CONVERSATION_END)
+
+    enqueue_static_triggers_batch(
+        session.id, [StaticTriggerType.CONVERSATION_START, StaticTriggerType.NEW_HUMAN_MESSAGE]
+    )
+
+    assert mock_fire_trigger.call_args_list == [
+        mock.call(start_trigger.id, session.id),
+        mock.call(new_message_trigger.id, session.id),
+    ]
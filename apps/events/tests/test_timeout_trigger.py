@@ -48,14 +48,13 @@ def test_timed_out_sessions(session):
 
     with freeze_time("2024-04-02") as frozen_time:
         chat = Chat.objects.create(team=session.team)
-        message = ChatMessage.objects.create(
+        ChatMessage.objects.create(
             chat=chat,
             content="Hello",
             message_type=ChatMessageType.HUMAN,
         )
-        message.save()
         session.chat = chat
-        session.save()
+        session.save(update_fields=["chat"])
 
         frozen_time.tick(delta=timedelta(minutes=15))
         timed_out_sessions = timeout_trigger.timed_out_sessions()
@@ -79,7 +78,7 @@ def test_non_timed_out_sessions(session):
             message_type=ChatMessageType.HUMAN,
         )
         session.chat = chat
-        session.save()
+        session.save(update_fields=["chat"])
 
         frozen_time.tick(delta=timedelta(seconds=5))
         timed_out_sessions = timeout_trigger.timed_out_sessions()
@@ -99,14 +98,13 @@ def test_timed_out_sessions_fired(mock_fire_trigger, session):
 
     with freeze_time("2024-04-02") as frozen_time:
         chat = Chat.objects.create(team=session.team)
-        message = ChatMessage.objects.create(
+        ChatMessage.objects.create(
             chat=chat,
             content="Hello",
             message_type=ChatMessageType.HUMAN,
         )
-        message.save()
         session.chat = chat
-        session.save()
+        session.save(update_fields=["chat"])
 
         frozen_time.tick(delta=timedelta(minutes=15))
         timed_out_sessions = timeout_trigger.timed_out_sessions()
@@ -130,9 +128,8 @@ def test_trigger_count_reached(session):
             content="Hello",
             message_type=ChatMessageType.HUMAN,
         )
-        message.save()
         session.chat = chat
-        session.save()
+        session.save(update_fields=["chat"])
         frozen_time.tick(delta=timedelta(minutes=11))
 
         timeout_trigger.event_logs.create(session=session, chat_message=message, status=EventLogStatusChoices.SUCCESS)
@@ -143,12 +140,11 @@ def test_trigger_count_reached(session):
         assert len(timeout_trigger.timed_out_sessions()) == 0
 
         # The timeout passes after the next message is sent
-        message_2 = ChatMessage.objects.create(
+        ChatMessage.objects.create(
             chat=chat,
             content="Hello",
             message_type=ChatMessageType.HUMAN,
         )
-        message_2.save()
         frozen_time.tick(delta=timedelta(minutes=11))
         assert len(timeout_trigger.timed_out_sessions()) == 1
 
@@ -177,9 +173,8 @@ def test_failure_count_reached(session):
             content="Hello",
             message_type=ChatMessageType.HUMAN,
         )
-        message.save()
         session.chat = chat
-        session.save()
+        session.save(update_fields=["chat"])
         frozen_time.tick(delta=timedelta(minutes=11))
         assert len(timeout_trigger.timed_out_sessions()) == 1
 
@@ -201,7 +196,7 @@ def test_fire_trigger_increments_stats(session):
         message_type=ChatMessageType.HUMAN,
     )
     session.chat = chat
-    session.save()
+    session.save(update_fields=["chat"])
     timeout_trigger = TimeoutTrigger.objects.create(
         experiment=session.experiment,
         action=EventAction.objects.create(action_type=EventActionType.LOG),
@@ -228,7 +223,7 @@ def test_new_human_message_resets_count(session):
         message_type=ChatMessageType.HUMAN,
     )
     session.chat = chat
-    session.save()
+    session.save(update_fields=["chat"])
     timeout_trigger = TimeoutTrigger.objects.create(
         experiment=session.experiment,
         action=EventAction.objects.create(action_type=EventActionType.LOG),
@@ -274,7 +269,7 @@ def test_new_human_message_resets_count(session):
 )
 def test_not_triggered_for_complete_chats(status, matches, session):
     session.status = status
-    session.save()
+    session.save(update_fields=["status"])
     timeout_trigger = TimeoutTrigger.objects.create(
         experiment=session.experiment,
         action=EventAction.objects.create(action_type=EventActionType.LOG),
@@ -282,14 +277,13 @@ def test_not_triggered_for_complete_chats(status, matches, session):
     )
     with freeze_time("2024-04-02") as frozen_time:
         chat = Chat.objects.create(team=session.team)
-        message = ChatMessage.objects.create(
+        ChatMessage.objects.create(
             chat=chat,
             content="Hello",
             message_type=ChatMessageType.HUMAN,
         )
-        message.save()
         session.chat = chat
-        session.save()
+        session.save(update_fields=["chat"])
 
         frozen_time.tick(delta=timedelta(minutes=15))
         timed_out_sessions = timeout_trigger.timed_out_sessions()
@@ -309,14 +303,13 @@ def test_not_triggered_no_human_message(session):
     )
     with freeze_time("2024-04-02") as frozen_time:
         chat = Chat.objects.create(team=session.team)
-        message = ChatMessage.objects.create(
+        ChatMessage.objects.create(
             chat=chat,
             content="Hello",
             message_type=ChatMessageType.AI,
         )
-        message.save()
         session.chat = chat
-        session.save()
+        session.save(update_fields=["chat"])
 
         frozen_time.tick(delta=timedelta(minutes=15))
         timed_out_sessions = timeout_trigger.timed_out_sessions()
@@ -7,14 +7,14 @@ def _create_agent_tool_resouces(apps, schema_editor):
     Experiment = apps.get_model("experiments", "Experiment")
     from apps.experiments.models import AgentTools
 
-    for experiment in Experiment.objects.filter(tools_enabled=True):
-        experiment.tools = [AgentTools.RECURRING_REMINDER, AgentTools.ONE_OFF_REMINDER]
-        experiment.save()
-        
+    Experiment.objects.filter(tools_enabled=True).update(
+        tools=[AgentTools.RECURRING_REMINDER.value, AgentTools.ONE_OFF_REMINDER.value]
+    )
+
 
 def _remove_agent_tool_resouces(apps, schema_editor):
     Experiment = apps.get_model("experiments", "Experiment")
-    Experiment.objects.all.update(tools=[])
+    Experiment.objects.update(tools=[])
 
 
 class Migration(migrations.Migration):
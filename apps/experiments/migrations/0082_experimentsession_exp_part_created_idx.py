@@ -0,0 +1,16 @@
+# Generated by Django 4.2.11 on 2026-10-15 16:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("experiments", "0081_rename_public_id_experimentsession_external_id_and_more"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="experimentsession",
+            index=models.Index(fields=["experiment", "participant", "-created_at"], name="exp_part_created_idx"),
+        ),
+    ]
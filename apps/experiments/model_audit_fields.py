@@ -1,4 +1,4 @@
-EXPERIMENT_FIELDS = [
+EXPERIMENT_FIELDS = (
     "owner",
     "name",
     "llm_provider",
@@ -19,11 +19,11 @@ EXPERIMENT_FIELDS = [
     "conversational_consent_enabled",
     "team",
     "voice_response_behaviour",
-]
+)
 
-SOURCE_MATERIAL_FIELDS = ["owner", "topic", "description", "material", "team"]
-SAFETY_LAYER_FIELDS = ["prompt_text", "messages_to_review", "default_response_to_user", "prompt_to_bot", "team"]
-CONSENT_FORM_FIELDS = [
+SOURCE_MATERIAL_FIELDS = ("owner", "topic", "description", "material", "team")
+SAFETY_LAYER_FIELDS = ("prompt_text", "messages_to_review", "default_response_to_user", "prompt_to_bot", "team")
+CONSENT_FORM_FIELDS = (
     "name",
     "consent_text",
     "capture_identifier",
@@ -31,16 +31,16 @@ CONSENT_FORM_FIELDS = [
     "identifier_type",
     "confirmation_text",
     "team",
-]
+)
 
-EXPERIMENT_CHANNEL_FIELDS = [
+EXPERIMENT_CHANNEL_FIELDS = (
     "name",
     "experiment",
     "deleted",
     "extra_data",
     "platform",
     "messaging_provider",
-]
+)
 
-NO_ACTIVITY_CONFIG_FIELDS = ["message_for_bot", "name", "max_pings", "ping_after", "team"]
-SYNTHETIC_VOICE_FIELDS = ["name", "file", "voice_provider", "language", "gender", "language_code"]
+NO_ACTIVITY_CONFIG_FIELDS = ("message_for_bot", "name", "max_pings", "ping_after", "team")
+SYNTHETIC_VOICE_FIELDS = ("name", "file", "voice_provider", "language", "gender", "language_code")
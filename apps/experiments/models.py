@@ -12,7 +12,7 @@ from django.contrib.contenttypes.models import ContentType
 from django.contrib.postgres.fields import ArrayField
 from django.core.validators import MaxValueValidator, MinValueValidator, validate_email
 from django.db import models, transaction
-from django.db.models import Count, OuterRef, Prefetch, Q, Subquery
+from django.db.models import Count, OuterRef, Q, Subquery
 from django.urls import reverse
 from django.utils import timezone
 from django.utils.translation import gettext
@@ -525,23 +525,41 @@ class Participant(BaseTeamModel):
         experiment:
             If specified, only the data for this experiment will be updated
         """
-        experiments = Experiment.objects.filter(team=self.team).prefetch_related(
-            Prefetch("participant_data", queryset=ParticipantData.objects.filter(participant=self))
-        )
+        experiment_ids = Experiment.objects.filter(team=self.team).values_list("id", flat=True)
         if experiment:
-            experiments = experiments.filter(id=experiment.id)
+            experiment_ids = experiment_ids.filter(id=experiment.id)
+        experiment_ids = list(experiment_ids)
+
+        # Query the data records directly instead of through the experiments to avoid loading every experiment
+        content_type = ContentType.objects.get_for_model(Experiment)
+        existing_data = {
+            participant_data.object_id: participant_data
+            for participant_data in ParticipantData.objects.filter(
+                participant=self, content_type=content_type, object_id__in=experiment_ids
+            )
+        }
 
         records_to_update = []
-        for experiment in experiments:
-            participant_data = experiment.participant_data.first()
+        records_to_create = []
+        for experiment_id in experiment_ids:
+            participant_data = existing_data.get(experiment_id)
             # We cannot update the participant data using a single query, since the `data` field is encrypted at
             # the application level
             if participant_data:
                 participant_data.data = participant_data.data | data
                 records_to_update.append(participant_data)
             else:
-                ParticipantData.objects.create(team=self.team, content_object=experiment, data=data, participant=self)
+                records_to_create.append(
+                    ParticipantData(
+                        team=self.team,
+                        content_type=content_type,
+                        object_id=experiment_id,
+                        data=data,
+                        participant=self,
+                    )
+                )
 
+        ParticipantData.objects.bulk_create(records_to_create)
         ParticipantData.objects.bulk_update(records_to_update, fields=["data"])
 
     class Meta:
@@ -622,6 +640,7 @@ class ExperimentSession(BaseTeamModel):
 
     class Meta:
         ordering = ["-created_at"]
+        indexes = [models.Index(fields=["experiment", "participant", "-created_at"], name="exp_part_created_idx")]
 
     def save(self, *args, **kwargs):
         if not hasattr(self, "chat"):
@@ -635,10 +654,11 @@ class ExperimentSession(BaseTeamModel):
         return bool(self.get_messages_for_display())
 
     def get_messages_for_display(self):
+        messages = ChatMessage.prefetch_tags(self.chat.messages.all())
         if self.seed_task_id:
-            return self.chat.messages.all()[1:]
+            return messages[1:]
         else:
-            return self.chat.messages.all()
+            return messages
 
     def get_participant_display(self) -> str:
         if self.participant:
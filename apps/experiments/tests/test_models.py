@@ -1,11 +1,12 @@
 from unittest.mock import Mock, patch
 
 import pytest
+from django.contrib.contenttypes.models import ContentType
 from freezegun import freeze_time
 
 from apps.events.actions import ScheduleTriggerAction
 from apps.events.models import EventActionType, ScheduledMessage, TimePeriod
-from apps.experiments.models import ExperimentRoute, ParticipantData, SyntheticVoice
+from apps.experiments.models import Experiment, ExperimentRoute, ParticipantData, SyntheticVoice
 from apps.utils.factories.events import EventActionFactory, ScheduledMessageFactory
 from apps.utils.factories.experiment import (
     ExperimentFactory,
@@ -270,3 +271,16 @@ class TestParticipant:
             "first_name": "Bootstrap Bill",
             "last_name": "Turner",
         }
+
+    @pytest.mark.django_db()
+    def test_update_memory_creates_missing_data_in_bulk(self, django_assert_num_queries):
+        participant = ParticipantFactory()
+        team = participant.team
+        ExperimentSessionFactory.create_batch(3, participant=participant, team=team, experiment__team=team)
+        ContentType.objects.get_for_model(Experiment)  # warm the content type cache
+
+        # `update_memory` runs in a savepoint (2 queries), then it fetches the experiment IDs (1) and their existing
+        # data (1) and creates all the missing data with a single insert (1)
+        with django_assert_num_queries(5):
+            participant.update_memory({"timezone": "Africa/Johannesburg"})
+        assert ParticipantData.objects.filter(participant=participant).count() == 3
@@ -1,8 +1,9 @@
 from unittest.mock import Mock, patch
 
-from apps.chat.bots import TopicBot
+from apps.chat.bots import SafetyBot, TopicBot
 from apps.experiments.models import SafetyLayer
 from apps.utils.factories.experiment import ExperimentSessionFactory
+from apps.utils.langchain import FakeLlm
 
 
 @patch("apps.chat.bots.notify_users_of_violation")
@@ -20,3 +21,13 @@ def test_violation_triggers_email(notify_users_of_violation_mock, create_convers
     bot._call_predict = Mock()
     bot.process_input("It's my way or the highway!")
     notify_users_of_violation_mock.assert_called()
+
+
+def test_safety_bot_reviews_each_message_on_its_own():
+    llm = FakeLlm(responses=["safe", "unsafe"], token_counts=[0], calls=[])
+    bot = SafetyBot(SafetyLayer(prompt_text="Is this message safe?"), llm, source_material=None)
+
+    assert bot.is_safe("Hi")
+    assert not bot.is_safe("Bye")
+    second_review = llm.get_call_messages()[-1]
+    assert [message.content for message in second_review[1:]] == ["Bye"]
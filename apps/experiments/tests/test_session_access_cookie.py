@@ -13,7 +13,7 @@ def session():
     session = ExperimentSessionFactory()
     participant = Participant.objects.create(team=session.team, identifier="test@test.com")
     session.participant = participant
-    session.save()
+    session.save(update_fields=["participant"])
     return session
 
 
@@ -7,7 +7,9 @@ from django.core.exceptions import ValidationError
 from django.urls import reverse
 from waffle.testutils import override_flag
 
+from apps.channels.models import ChannelPlatform
 from apps.chat.channels import WebChannel
+from apps.events.models import StaticTriggerType
 from apps.experiments.models import (
     AgentTools,
     Experiment,
@@ -16,10 +18,11 @@ from apps.experiments.models import (
     ParticipantData,
     VoiceResponseBehaviours,
 )
-from apps.experiments.views.experiment import ExperimentForm, _validate_prompt_variables
+from apps.experiments.views.experiment import ExperimentForm, _get_events_context, _validate_prompt_variables
 from apps.teams.backends import add_user_to_team
 from apps.utils.factories.assistants import OpenAiAssistantFactory
 from apps.utils.factories.channels import ExperimentChannelFactory
+from apps.utils.factories.events import EventActionFactory, StaticTriggerFactory
 from apps.utils.factories.experiment import ConsentFormFactory, ExperimentFactory, SourceMaterialFactory
 from apps.utils.factories.service_provider_factories import LlmProviderFactory
 from apps.utils.factories.team import TeamWithUsersFactory, UserFactory
@@ -125,7 +128,7 @@ def test_form_fields(_get_for_team_mock):
 
 @pytest.mark.django_db()
 @pytest.mark.parametrize("is_user", [False, True])
-@mock.patch("apps.chat.channels.enqueue_static_triggers")
+@mock.patch("apps.chat.channels.enqueue_static_triggers_batch")
 def test_new_participant_created_on_session_start(_trigger_mock, is_user):
     """For each new experiment session, a participant should be created and linked to the session"""
     identifier = "someone@example.com"
@@ -150,7 +153,7 @@ def test_new_participant_created_on_session_start(_trigger_mock, is_user):
 
 @pytest.mark.django_db()
 @pytest.mark.parametrize("is_user", [False, True])
-@mock.patch("apps.chat.channels.enqueue_static_triggers")
+@mock.patch("apps.chat.channels.enqueue_static_triggers_batch")
 def test_start_session_public_with_emtpy_identifier(_trigger_mock, is_user, client):
     """Identifiers can be empty if we choose not to capture it. In this case, use the logged in user's email or in
     the case where it's an external user, use a UUID as the identifier"""
@@ -176,7 +179,7 @@ def test_start_session_public_with_emtpy_identifier(_trigger_mock, is_user, clie
 
 @pytest.mark.django_db()
 @pytest.mark.parametrize("is_user", [False, True])
-@mock.patch("apps.chat.channels.enqueue_static_triggers")
+@mock.patch("apps.chat.channels.enqueue_static_triggers_batch")
 def test_participant_reused_within_team(_trigger_mock, is_user):
     """Within a team, the same external chat id (or participant identifier) should result in the participant being
     reused, and not result in a new participant being created
@@ -217,9 +220,31 @@ def test_participant_reused_within_team(_trigger_mock, is_user):
     assert session.participant.identifier == identifier
 
 
+@pytest.mark.django_db()
+@mock.patch("apps.chat.channels.enqueue_static_triggers_batch")
+def test_participant_joined_trigger_only_for_first_session(trigger_mock):
+    experiment = ExperimentFactory(team=TeamWithUsersFactory())
+    channel = ExperimentChannelFactory(experiment=experiment, platform=ChannelPlatform.WEB)
+
+    def _triggers_for_new_session():
+        trigger_mock.reset_mock()
+        session = WebChannel.start_new_session(
+            experiment, experiment_channel=channel, participant_identifier="someone@example.com"
+        )
+        return [call.args for call in trigger_mock.delay.call_args_list], session
+
+    triggers, session = _triggers_for_new_session()
+    assert triggers == [
+        (session.id, [StaticTriggerType.PARTICIPANT_JOINED_EXPERIMENT, StaticTriggerType.CONVERSATION_START])
+    ]
+
+    triggers, session = _triggers_for_new_session()
+    assert triggers == [(session.id, [StaticTriggerType.CONVERSATION_START])]
+
+
 @pytest.mark.django_db()
 @pytest.mark.parametrize("is_user", [False, True])
-@mock.patch("apps.chat.channels.enqueue_static_triggers")
+@mock.patch("apps.chat.channels.enqueue_static_triggers_batch")
 def test_new_participant_created_for_different_teams(_trigger_mock, is_user):
     """A new participant should be created for each team when a user uses the same identifier"""
     experiment1 = ExperimentFactory(team=TeamWithUsersFactory())
@@ -267,7 +292,7 @@ def test_new_participant_created_for_different_teams(_trigger_mock, is_user):
 
 
 @pytest.mark.django_db()
-@mock.patch("apps.chat.channels.enqueue_static_triggers")
+@mock.patch("apps.chat.channels.enqueue_static_triggers_batch")
 def test_participant_gets_user_when_they_signed_up(_trigger_mock, client):
     """When a non platform user starts a session, a participant without a user is created. When they then sign up
     and start another session, their participant user should be populated
@@ -303,7 +328,7 @@ def test_participant_gets_user_when_they_signed_up(_trigger_mock, client):
 
 
 @pytest.mark.django_db()
-@mock.patch("apps.chat.channels.enqueue_static_triggers")
+@mock.patch("apps.chat.channels.enqueue_static_triggers_batch")
 def test_user_email_used_for_participant_identifier(_trigger_mock, client):
     """With the `capture_identifier` field enabled on the consent record, logged in users' consent form will
     not contain the `identifier` field, so we pass it as initial data to the form. This test simulates a logged
@@ -326,7 +351,7 @@ def test_user_email_used_for_participant_identifier(_trigger_mock, client):
 
 
 @pytest.mark.django_db()
-@mock.patch("apps.chat.channels.enqueue_static_triggers")
+@mock.patch("apps.chat.channels.enqueue_static_triggers_batch")
 def test_timezone_saved_in_participant_data(_trigger_mock):
     """A participant's timezone data should be saved in all ParticipantData records"""
     experiment = ExperimentFactory(team=TeamWithUsersFactory())
@@ -351,3 +376,18 @@ def test_timezone_saved_in_participant_data(_trigger_mock):
     part_data2.refresh_from_db()
     assert part_data1.data["timezone"] == "Africa/Johannesburg"
     assert part_data2.data["timezone"] == "Africa/Johannesburg"
+
+
+@pytest.mark.django_db()
+def test_events_context_renders_action_params(django_assert_num_queries):
+    experiment = ExperimentFactory()
+    action = EventActionFactory(params={"prompt_text": "Summarize"})
+    StaticTriggerFactory(experiment=experiment, action=action)
+    _get_events_context(experiment, experiment.team.slug)  # warm the content type cache
+
+    with django_assert_num_queries(2):
+        context = _get_events_context(experiment, experiment.team.slug)
+        rows = list(context["events_table"].rows)
+
+    assert len(rows) == 1
+    assert "Summarize" in rows[0].get_cell("action_params")
@@ -13,7 +13,7 @@ from django.contrib.auth.mixins import PermissionRequiredMixin
 from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
 from django.core.exceptions import PermissionDenied, ValidationError
 from django.db import transaction
-from django.db.models import Case, Count, IntegerField, Q, When
+from django.db.models import Count, Q
 from django.http import Http404, HttpResponse, HttpResponseRedirect
 from django.shortcuts import get_object_or_404, redirect, render
 from django.template.response import TemplateResponse
@@ -450,23 +450,17 @@ def single_experiment_home(request, team_slug: str, experiment_id: int):
 
 def _get_events_context(experiment: Experiment, team_slug: str):
     combined_events = []
+    # fetch everything the table renders in one query per trigger type so rows never touch the related action
+    failure_count = Count("event_logs", filter=Q(event_logs__status=EventLogStatusChoices.FAILURE))
     static_events = (
         StaticTrigger.objects.filter(experiment=experiment)
-        .annotate(
-            failure_count=Count(
-                Case(When(event_logs__status=EventLogStatusChoices.FAILURE, then=1), output_field=IntegerField())
-            )
-        )
+        .annotate(failure_count=failure_count)
         .values("id", "experiment_id", "type", "action__action_type", "action__params", "failure_count")
         .all()
     )
     timeout_events = (
         TimeoutTrigger.objects.filter(experiment=experiment)
-        .annotate(
-            failure_count=Count(
-                Case(When(event_logs__status=EventLogStatusChoices.FAILURE, then=1), output_field=IntegerField())
-            )
-        )
+        .annotate(failure_count=failure_count)
         .values(
             "id",
             "experiment_id",
@@ -72,12 +72,12 @@ class LogHandler:
         from apps.pipelines.models import LogEntry
 
         record = message.record
-        log_entry = LogEntry(
-            **{
-                "time": record["time"].strftime("%Y-%m-%d %H:%M:%S.%f"),
-                "level": record["level"].name,
-                "message": record["message"],
-            }
+        # The record fields are already typed so skip validation. The time is stored without the timezone
+        # as it was when it was round-tripped through a formatted string.
+        log_entry = LogEntry.model_construct(
+            time=record["time"].replace(tzinfo=None),
+            level=record["level"].name,
+            message=record["message"],
         )
         # Appending to a list is thread safe in python
         self.pipeline_run.log["entries"].append(log_entry.model_dump())
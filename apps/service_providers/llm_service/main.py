@@ -1,6 +1,10 @@
+import functools
+import ssl
 from io import BytesIO
 from typing import ClassVar
 
+import httpx
+import openai
 import pydantic
 from langchain.agents.openai_assistant import OpenAIAssistantRunnable as BrokenOpenAIAssistantRunnable
 from langchain.chat_models.base import BaseChatModel
@@ -15,6 +19,25 @@ from openai._base_client import SyncAPIClient
 
 from apps.service_providers.llm_service.callbacks import TokenCountingCallbackHandler
 
+# Building an SSL context touches the filesystem so share one across all the OpenAI clients we create
+_SHARED_SSL_CONTEXT = ssl.create_default_context()
+
+
+@functools.lru_cache(maxsize=64)
+def _get_openai_client(api_key: str, organization: str | None, base_url: str | None) -> OpenAI:
+    """Return a cached OpenAI client for the given credentials so that the underlying
+    connection pool is reused across calls."""
+    http_client = openai.DefaultHttpxClient(
+        verify=_SHARED_SSL_CONTEXT,
+        limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+    )
+    return OpenAI(api_key=api_key, organization=organization, base_url=base_url, http_client=http_client)
+
+
+def clear_client_cache():
+    """Drop all cached OpenAI clients e.g. after provider credentials have been rotated."""
+    _get_openai_client.cache_clear()
+
 
 class OpenAIAssistantRunnable(BrokenOpenAIAssistantRunnable):
     # This is a temporary solution to fix langchain's compatability with the assistants v2 API. This code is
@@ -108,7 +131,7 @@ class OpenAILlmService(LlmService):
     openai_organization: str = None
 
     def get_raw_client(self) -> OpenAI:
-        return OpenAI(api_key=self.openai_api_key, organization=self.openai_organization, base_url=self.openai_api_base)
+        return _get_openai_client(self.openai_api_key, self.openai_organization, self.openai_api_base)
 
     def get_assistant(self, assistant_id: str, as_agent=False):
         return OpenAIAssistantRunnable(assistant_id=assistant_id, as_agent=as_agent, client=self.get_raw_client())
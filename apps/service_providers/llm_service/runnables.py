@@ -2,7 +2,7 @@ import logging
 import re
 import time
 from abc import ABC
-from operator import itemgetter
+from functools import cached_property, lru_cache
 from time import sleep
 from typing import Any, Literal
 
@@ -28,12 +28,17 @@ from apps.annotations.models import Tag
 from apps.channels.models import ChannelPlatform
 from apps.chat.agent.tools import get_tools
 from apps.chat.conversation import compress_chat_history
-from apps.chat.models import ChatMessage, ChatMessageType
+from apps.chat.models import Chat, ChatMessage, ChatMessageType
 from apps.experiments.models import Experiment, ExperimentRoute, ExperimentSession
 from apps.utils.time import pretty_date
 
 logger = logging.getLogger(__name__)
 
+CANCELLED_RUN_RE = re.compile(r"cancelling|cancelled")
+ACTIVE_RUN_RE = re.compile(r"(thread_\w+) while a run (run_\w+) is active")
+CANCEL_RUN_MAX_POLL_INTERVAL = 2
+CANCEL_RUN_TIMEOUT = 30
+
 
 class GenerationError(Exception):
     pass
@@ -85,15 +90,20 @@ class BaseExperimentRunnable(RunnableSerializable[dict, ChainOutput], ABC):
 
     class Config:
         arbitrary_types_allowed = True
+        keep_untouched = (cached_property,)
 
-    @property
+    @cached_property
     def llm_service(self):
         return self.experiment.get_llm_service()
 
+    @cached_property
+    def chat_model(self):
+        """The model is shared by the callback handler, the history compression and the chain"""
+        return self.llm_service.get_chat_model(self.experiment.llm, self.experiment.temperature)
+
     @property
     def callback_handler(self):
-        model = self.llm_service.get_chat_model(self.experiment.llm, self.experiment.temperature)
-        return self.llm_service.get_callback_handler(model)
+        return self.llm_service.get_callback_handler(self.chat_model)
 
     def _save_message_to_history(self, message: str, type_: ChatMessageType):
         ChatMessage.objects.create(
@@ -107,7 +117,7 @@ class BaseExperimentRunnable(RunnableSerializable[dict, ChainOutput], ABC):
             input[self.input_key] = self.experiment.input_formatter.format(input=input[self.input_key])
         return input
 
-    @property
+    @cached_property
     def is_unauthorized_participant(self):
         """Returns `true` if a participant is unauthorized. A participant is considered authorized when the
         following conditions are met:
@@ -128,7 +138,7 @@ class BaseExperimentRunnable(RunnableSerializable[dict, ChainOutput], ABC):
 class ExperimentRunnable(BaseExperimentRunnable):
     memory: BaseMemory = ConversationBufferMemory(return_messages=True, output_key="output", input_key="input")
     cancelled: bool = False
-    last_cancel_check: float | None = None
+    next_cancel_check_ns: int = 0
     check_every_ms: int = 1000
 
     class Config:
@@ -165,12 +175,13 @@ class ExperimentRunnable(BaseExperimentRunnable):
     def _get_output_check_cancellation(self, input, config):
         chain = self._build_chain()
 
-        output = ""
+        chunks = []
         for token in chain.stream(input, config):
-            output += self._parse_output(token)
+            chunks.append(self._parse_output(token))
+            # `_chat_is_cancelled` limits how often it hits the DB so it's cheap to call per token
             if self._chat_is_cancelled():
-                return output
-        return output
+                break
+        return "".join(chunks)
 
     def _parse_output(self, output):
         return output
@@ -179,16 +190,17 @@ class ExperimentRunnable(BaseExperimentRunnable):
         if self.cancelled:
             return True
 
-        if self.last_cancel_check and self.check_every_ms:
-            if self.last_cancel_check + self.check_every_ms > time.time():
-                return False
+        now = time.monotonic_ns()
+        if now < self.next_cancel_check_ns:
+            return False
 
-        self.last_cancel_check = time.time()
+        self.next_cancel_check_ns = now + self.check_every_ms * 1_000_000
 
-        self.session.chat.refresh_from_db(fields=["metadata"])
+        # only the metadata is needed so skip refreshing the chat instance
+        metadata = Chat.objects.filter(id=self.session.chat_id).values_list("metadata", flat=True).first() or {}
         # temporary mechanism to cancel the chat
         # TODO: change this to something specific to the current chat message
-        if self.session.chat.metadata.get("cancelled", False):
+        if metadata.get("cancelled", False):
             self.cancelled = True
 
         return self.cancelled
@@ -200,25 +212,26 @@ class ExperimentRunnable(BaseExperimentRunnable):
     def _build_chain(self) -> Runnable[dict[str, Any], Any]:
         raise NotImplementedError
 
+    @property
+    def current_datetime(self):
+        return pretty_date(timezone.now(), self.session.get_participant_timezone())
+
+    def _get_prompt_variables(self) -> dict:
+        """Resolved once when the chain is built rather than inside it: the agent calls the chain once per step and
+        the chain's steps may run on other threads (and DB connections)."""
+        return {
+            "source_material": self.source_material,
+            "participant_data": self.participant_data,
+            "current_datetime": self.current_datetime,
+        }
+
     @property
     def prompt(self):
-        participant_tz = self.session.get_participant_timezone()
-        current_datetime = pretty_date(timezone.now(), participant_tz)
-        # The bot converts to UTC unless we tell it to preserve the given timezone
-        prompt = self.experiment.prompt_text + f"\nThe current datetime is {current_datetime} (timezone preserved)"
-        system_prompt = SystemMessagePromptTemplate.from_template(prompt)
-        return ChatPromptTemplate.from_messages(
-            [
-                system_prompt,
-                MessagesPlaceholder("history", optional=True),
-                ("human", "{input}"),
-            ]
-        )
+        return _build_chat_prompt(self.experiment.prompt_text)
 
     def _populate_memory(self):
         # TODO: convert to use BaseChatMessageHistory object
-        model = self.llm_service.get_chat_model(self.experiment.llm, self.experiment.temperature)
-        messages = compress_chat_history(self.session.chat, model, self.experiment.max_token_limit)
+        messages = compress_chat_history(self.session.chat, self.chat_model, self.experiment.max_token_limit)
         self.memory.chat_memory.messages = messages
 
     def _save_message_to_history(self, message: str, type_: ChatMessageType, add_experiment_tag: bool = False):
@@ -228,27 +241,36 @@ class ExperimentRunnable(BaseExperimentRunnable):
             content=message,
         )
         if add_experiment_tag:
-            exp_route = ExperimentRoute.objects.filter(
-                team=self.session.team, child=self.experiment.id, parent=self.session.experiment
-            ).first()
-            if not Tag.objects.filter(name=exp_route.keyword, team=self.session.team).exists() and exp_route:
-                chat_message.tags.create(team=self.session.team, name=exp_route.keyword, is_system_tag=True)
-            chat_message.add_tags([exp_route.keyword], team=self.session.team, added_by=None)
+            self._tag_message_with_experiment_route(chat_message)
+
+    def _tag_message_with_experiment_route(self, chat_message: ChatMessage):
+        team = self.session.team
+        exp_route = (
+            ExperimentRoute.objects.filter(team=team, child=self.experiment.id, parent=self.session.experiment)
+            .only("keyword")
+            .first()
+        )
+        if not exp_route:
+            return
+
+        tags = list(Tag.objects.filter(team=team, name=exp_route.keyword))
+        if not tags:
+            tags = [Tag.objects.create(team=team, name=exp_route.keyword, is_system_tag=True)]
+        chat_message.tags.add(*tags, through_defaults={"team": team, "user": None})
 
 
 class SimpleExperimentRunnable(ExperimentRunnable):
     def _build_chain(self) -> Runnable[dict[str, Any], str]:
-        model = self.llm_service.get_chat_model(self.experiment.llm, self.experiment.temperature)
+        prompt_variables = self._get_prompt_variables()
+        # the memory is only used to hold the history so use its messages directly rather than going
+        # through `load_memory_variables`
+        prompt_variables["history"] = self.memory.chat_memory.messages
         return (
             {"input": RunnablePassthrough()}
-            | RunnablePassthrough.assign(source_material=RunnableLambda(lambda x: self.source_material))
-            | RunnablePassthrough.assign(participant_data=RunnableLambda(lambda x: self.participant_data))
-            | RunnablePassthrough.assign(
-                history=RunnableLambda(self.memory.load_memory_variables) | itemgetter("history")
-            )
+            | RunnableLambda(lambda x: {**x, **prompt_variables})
             | RunnableLambda(self.format_input)
             | self.prompt
-            | model
+            | self.chat_model
             | StrOutputParser()
         )
 
@@ -259,13 +281,12 @@ class AgentExperimentRunnable(ExperimentRunnable):
 
     def _build_chain(self) -> Runnable[dict[str, Any], dict]:
         assert self.experiment.tools_enabled
-        model = self.llm_service.get_chat_model(self.experiment.llm, self.experiment.temperature)
         tools = get_tools(self.session)
+        prompt_variables = self._get_prompt_variables()
         agent = (
-            RunnablePassthrough.assign(source_material=RunnableLambda(lambda x: self.source_material))
-            | RunnablePassthrough.assign(participant_data=RunnableLambda(lambda x: self.participant_data))
+            RunnableLambda(lambda x: {**x, **prompt_variables})
             | RunnableLambda(self.format_input)
-            | create_tool_calling_agent(llm=model, tools=tools, prompt=self.prompt)
+            | create_tool_calling_agent(llm=self.chat_model, tools=tools, prompt=self.prompt)
         )
         executor = AgentExecutor.from_agent_and_tools(
             agent=agent,
@@ -277,8 +298,25 @@ class AgentExperimentRunnable(ExperimentRunnable):
 
     @property
     def prompt(self):
-        prompt = super().prompt
-        return ChatPromptTemplate.from_messages(prompt.messages + [MessagesPlaceholder("agent_scratchpad")])
+        return _build_chat_prompt(self.experiment.prompt_text, with_scratchpad=True)
+
+
+@lru_cache(maxsize=256)
+def _build_chat_prompt(prompt_text: str, with_scratchpad: bool = False) -> ChatPromptTemplate:
+    """The templates only depend on the experiment's prompt so they are built once and shared. The current datetime
+    is passed in as a variable when the chain is invoked."""
+    # The bot converts to UTC unless we tell it to preserve the given timezone
+    system_prompt = SystemMessagePromptTemplate.from_template(
+        prompt_text + "\nThe current datetime is {current_datetime} (timezone preserved)"
+    )
+    messages = [
+        system_prompt,
+        MessagesPlaceholder("history", optional=True),
+        ("human", "{input}"),
+    ]
+    if with_scratchpad:
+        messages.append(MessagesPlaceholder("agent_scratchpad"))
+    return ChatPromptTemplate.from_messages(messages)
 
 
 class AssistantExperimentRunnable(BaseExperimentRunnable):
@@ -287,7 +325,7 @@ class AssistantExperimentRunnable(BaseExperimentRunnable):
     class Config:
         arbitrary_types_allowed = True
 
-    @property
+    @cached_property
     def chat(self):
         return self.session.chat
 
@@ -331,7 +369,7 @@ class AssistantExperimentRunnable(BaseExperimentRunnable):
             except openai.BadRequestError as e:
                 self._handle_api_error(thread_id, assistant, e)
             except ValueError as e:
-                if re.search(r"cancelling|cancelled", str(e)):
+                if CANCELLED_RUN_RE.search(str(e)):
                     raise GenerationCancelled(ChainOutput(output="", prompt_tokens=0, completion_tokens=0))
             else:
                 return response
@@ -342,7 +380,7 @@ class AssistantExperimentRunnable(BaseExperimentRunnable):
         This should either raise an exception or return if the error was handled and the run should be retried.
         """
         message = exc.body.get("message") or ""
-        match = re.match(r".*(thread_[\w]+) while a run (run_[\w]+) is active.*", message)
+        match = ACTIVE_RUN_RE.search(message)
         if not match:
             raise exc
 
@@ -355,9 +393,12 @@ class AssistantExperimentRunnable(BaseExperimentRunnable):
     def _cancel_run(self, assistant, thread_id, run_id):
         logger.info("Cancelling run %s in thread %s", run_id, thread_id)
         run = assistant.client.beta.threads.runs.cancel(thread_id=thread_id, run_id=run_id)
-        cancelling = run.status == "cancelling"
-        while cancelling:
+        delay = max(0.05, assistant.check_every_ms / 1000)
+        deadline = time.monotonic() + CANCEL_RUN_TIMEOUT
+        while run.status == "cancelling":
+            if time.monotonic() >= deadline:
+                logger.warning("Run %s in thread %s still cancelling after %ss", run_id, thread_id, CANCEL_RUN_TIMEOUT)
+                break
+            sleep(delay)
+            delay = min(delay * 1.5, CANCEL_RUN_MAX_POLL_INTERVAL)
             run = assistant.client.beta.threads.runs.retrieve(run_id, thread_id=thread_id)
-            cancelling = run.status == "cancelling"
-            if cancelling:
-                sleep(assistant.check_every_ms / 1000)
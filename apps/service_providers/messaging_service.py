@@ -7,7 +7,6 @@ from typing import ClassVar
 
 import boto3
 import pydantic
-import requests
 from botocore.client import Config
 from django.conf import settings
 from slack_sdk import WebClient
@@ -22,6 +21,7 @@ from apps.channels.models import ChannelPlatform
 from apps.chat.channels import MESSAGE_TYPES
 from apps.service_providers.exceptions import ServiceProviderConfigError
 from apps.service_providers.speech_service import SynthesizedAudio
+from apps.utils.http import DEFAULT_TIMEOUT, get_http_session, get_twilio_http_client
 
 logger = logging.getLogger(__name__)
 
@@ -60,11 +60,11 @@ class TwilioService(MessagingService):
     }
     MESSAGE_CHARACTER_LIMIT: int = 1600
 
-    @property
+    @cached_property
     def client(self) -> Client:
-        return Client(self.account_sid, self.auth_token)
+        return Client(self.account_sid, self.auth_token, http_client=get_twilio_http_client())
 
-    @property
+    @cached_property
     def s3_client(self):
         return boto3.client(
             "s3",
@@ -112,7 +112,7 @@ class TwilioService(MessagingService):
 
     def get_message_audio(self, message: TwilioMessage) -> BytesIO:
         auth = (self.account_sid, self.auth_token)
-        response = requests.get(message.media_url, auth=auth)
+        response = get_http_session().get(message.media_url, auth=auth, timeout=DEFAULT_TIMEOUT)
         # Example header: {'Content-Type': 'audio/ogg'}
         content_type = response.headers["Content-Type"].split("/")[1]
         return audio.convert_audio(BytesIO(response.content), target_format="wav", source_format=content_type)
@@ -126,7 +126,7 @@ class TurnIOService(MessagingService):
 
     auth_token: str
 
-    @property
+    @cached_property
     def client(self) -> TurnClient:
         return TurnClient(token=self.auth_token)
 
@@ -172,6 +172,22 @@ def test_assistant_runnable_cancels_existing_run(responses, exception, output, s
         cancel_run.assert_called_once()
 
 
+@patch("apps.service_providers.llm_service.runnables.sleep")
+def test_cancel_run_backs_off_until_cancelled(sleep, session):
+    assistant = mock.Mock(check_every_ms=100)
+    assistant.client.beta.threads.runs.cancel.return_value = _create_run("asst_1", "thread_abc", "cancelling")
+    assistant.client.beta.threads.runs.retrieve.side_effect = [
+        _create_run("asst_1", "thread_abc", "cancelling"),
+        _create_run("asst_1", "thread_abc", "cancelled"),
+    ]
+
+    runnable = AssistantExperimentRunnable(experiment=session.experiment, session=session)
+    runnable._cancel_run(assistant, "thread_abc", "run_abc")
+
+    assert assistant.client.beta.threads.runs.retrieve.call_count == 2
+    assert [call.args[0] for call in sleep.call_args_list] == [pytest.approx(0.1), pytest.approx(0.15)]
+
+
 def _get_assistant_mocked_history_recording(session):
     assistant = AssistantExperimentRunnable(experiment=session.experiment, session=session)
     assistant.__dict__["_save_message_to_history"] = lambda *args, **kwargs: None
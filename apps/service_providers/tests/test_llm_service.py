@@ -20,3 +20,12 @@ def test_azure_ai_service():
 def test_anthropic_service():
     service = AnthropicLlmService(anthropic_api_key="test", anthropic_api_base="https://api.anthropic.com")
     assert not service.supports_transcription
+
+
+def test_open_ai_raw_client_is_reused():
+    service = LlmProviderTypes.openai.get_llm_service({"openai_api_key": "test"})
+    client = service.get_raw_client()
+    assert service.get_raw_client() is client
+
+    other_service = LlmProviderTypes.openai.get_llm_service({"openai_api_key": "other"})
+    assert other_service.get_raw_client() is not client
@@ -6,8 +6,9 @@ import freezegun
 import pytest
 from langchain_core.messages import BaseMessage, SystemMessage
 
+from apps.annotations.models import Tag
 from apps.chat.models import Chat, ChatMessage, ChatMessageType
-from apps.experiments.models import AgentTools, ParticipantData, SourceMaterial
+from apps.experiments.models import AgentTools, ExperimentRoute, ParticipantData, SourceMaterial
 from apps.service_providers.llm_service.runnables import (
     AgentExperimentRunnable,
     ChainOutput,
@@ -15,7 +16,7 @@ from apps.service_providers.llm_service.runnables import (
     SimpleExperimentRunnable,
 )
 from apps.utils.factories.channels import ChannelPlatform, ExperimentChannelFactory
-from apps.utils.factories.experiment import ExperimentSessionFactory
+from apps.utils.factories.experiment import ExperimentFactory, ExperimentSessionFactory
 from apps.utils.langchain import FakeLlm, FakeLlmService
 
 
@@ -132,6 +133,24 @@ def test_runnable_save_input_to_history(runnable, session, chat, fake_llm):
     assert chat.messages.count() == 2
 
 
+@pytest.mark.django_db()
+def test_runnable_adds_experiment_route_tag(runnable, session, fake_llm):
+    child_experiment = ExperimentFactory(team=session.team)
+    ExperimentRoute.objects.create(
+        team=session.team, parent=session.experiment, child=child_experiment, keyword="child"
+    )
+    child_experiment.get_llm_service = session.experiment.get_llm_service
+    child_experiment.tools = session.experiment.tools
+    chain = runnable.build(experiment=child_experiment, session=session)
+
+    for _ in range(2):
+        chain.invoke("hi", config={"configurable": {"add_experiment_tag": True}})
+
+    ai_messages = session.chat.messages.filter(message_type=ChatMessageType.AI)
+    assert [message.tags.get().name for message in ai_messages] == ["child", "child"]
+    assert Tag.objects.get(team=session.team, name="child").is_system_tag
+
+
 @pytest.mark.django_db()
 @freezegun.freeze_time("2024-02-08 13:00:08.877096+00:00")
 def test_runnable_with_history(runnable, session, chat, fake_llm):
@@ -1,5 +1,6 @@
 from unittest.mock import patch
 
+import freezegun
 import pytest
 from langchain_core.messages import AIMessageChunk
 
@@ -13,6 +14,7 @@ from apps.service_providers.llm_service.runnables import (
     SimpleExperimentRunnable,
 )
 from apps.utils.factories.experiment import ExperimentSessionFactory
+from apps.utils.factories.team import TeamFactory
 from apps.utils.langchain import FakeLlm, FakeLlmService
 
 
@@ -23,10 +25,8 @@ def fake_llm():
 
 @pytest.fixture()
 def session(fake_llm):
-    chat = Chat()
+    chat = Chat.objects.create(team=TeamFactory())
     chat.get_langchain_messages_until_summary = lambda: []
-    chat.refresh_from_db = lambda *args, **kwargs: None
-    chat.save = lambda: None
     session = ExperimentSessionFactory.build(chat=chat)
     session.experiment.get_llm_service = lambda: FakeLlmService(llm=fake_llm)
     session.experiment.tools = [AgentTools.SCHEDULE_UPDATE]
@@ -56,6 +56,20 @@ def test_agent_runnable_cancellation(get_tools, session, fake_llm):
     _test_runnable(runnable, session, "")
 
 
+@pytest.mark.django_db()
+def test_cancellation_check_is_rate_limited(session, django_assert_num_queries):
+    runnable = SimpleExperimentRunnable(experiment=session.experiment, session=session, check_every_ms=1000)
+    with freezegun.freeze_time("2024-02-08 13:00:00") as frozen_time:
+        with django_assert_num_queries(1):
+            assert not runnable._chat_is_cancelled()
+            frozen_time.tick(0.5)
+            assert not runnable._chat_is_cancelled()
+
+        frozen_time.tick(1)
+        with django_assert_num_queries(1):
+            assert not runnable._chat_is_cancelled()
+
+
 def _test_runnable(runnable, session, expected_output):
     original_build = runnable._build_chain
 
@@ -67,7 +81,7 @@ def _test_runnable(runnable, session, expected_output):
             """Simulate a cancellation after the 2nd token."""
             for i, token in enumerate(orig_stream(*args, **kwargs)):
                 if i == 1:
-                    session.chat.metadata = {"cancelled": True}
+                    Chat.objects.filter(id=session.chat.id).update(metadata={"cancelled": True})
                 yield token
 
         chain.__dict__["stream"] = _stream
@@ -1,2 +1,2 @@
-TEAM_FIELDS = ["name", "slug", "members"]
-MEMBERSHIP_FIELDS = ["team", "user", "role"]
+TEAM_FIELDS = ("name", "slug", "members")
+MEMBERSHIP_FIELDS = ("team", "user", "role")
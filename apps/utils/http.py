@@ -0,0 +1,72 @@
+"""Process wide HTTP connection pools.
+
+Inbound message tasks make a handful of outbound HTTP calls each (downloading media, replying via a
+provider API). Sharing the underlying connection pool across tasks lets those calls reuse keep-alive
+connections instead of paying for a new TLS handshake every time.
+
+The pools are created lazily and are reset when a Celery worker process starts so that forked workers
+never share sockets with their parent.
+"""
+
+import threading
+from http.cookiejar import DefaultCookiePolicy
+
+import requests
+from celery.signals import worker_process_init, worker_process_shutdown
+from requests.adapters import HTTPAdapter
+from twilio.http.http_client import TwilioHttpClient
+from urllib3.util.retry import Retry
+
+POOL_MAXSIZE = 32
+# (connect, read) timeouts in seconds
+DEFAULT_TIMEOUT = (3.05, 30)
+
+_clients = {}
+_clients_lock = threading.Lock()
+
+
+def get_http_session() -> requests.Session:
+    """Returns the shared session. It is used for every tenant's requests so it doesn't keep cookies and
+    callers must pass credentials with each request."""
+    if "requests" not in _clients:
+        with _clients_lock:
+            if "requests" not in _clients:
+                _clients["requests"] = _create_http_session()
+    return _clients["requests"]
+
+
+def _create_http_session() -> requests.Session:
+    session = requests.Session()
+    # an empty list of allowed domains rejects all cookies
+    session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+    # urllib3 only retries idempotent requests and, without a status list, only on connection / read errors
+    adapter = HTTPAdapter(pool_maxsize=POOL_MAXSIZE, max_retries=Retry(total=3, backoff_factor=0.2))
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def get_twilio_http_client() -> TwilioHttpClient:
+    """Returns a new Twilio HTTP client that uses the shared session. A client is needed per Twilio client since
+    it keeps track of the last request and response."""
+    http_client = TwilioHttpClient(pool_connections=False)
+    http_client.session = get_http_session()
+    return http_client
+
+
+def close_http_clients():
+    with _clients_lock:
+        sessions = list(_clients.values())
+        _clients.clear()
+    for session in sessions:
+        session.close()
+
+
+@worker_process_init.connect
+def _reset_http_clients_on_worker_init(**kwargs):
+    close_http_clients()
+
+
+@worker_process_shutdown.connect
+def _close_http_clients_on_worker_shutdown(**kwargs):
+    close_http_clients()
@@ -0,0 +1,28 @@
+from urllib.request import Request
+
+from requests.cookies import create_cookie
+
+from apps.utils.http import close_http_clients, get_http_session, get_twilio_http_client
+
+
+def test_http_session_is_shared_until_closed():
+    session = get_http_session()
+    assert get_http_session() is session
+
+    close_http_clients()
+    assert get_http_session() is not session
+
+
+def test_twilio_http_clients_share_the_session():
+    first_client, second_client = get_twilio_http_client(), get_twilio_http_client()
+    assert first_client is not second_client
+    assert first_client.session is second_client.session is get_http_session()
+
+
+def test_http_session_does_not_keep_cookies():
+    session = get_http_session()
+    # this is how cookies from responses are added to the jar
+    session.cookies.set_cookie_if_ok(
+        create_cookie("sessionid", "123", domain="example.com"), Request("https://example.com")
+    )
+    assert not session.cookies
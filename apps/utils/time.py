@@ -1,10 +1,12 @@
 from datetime import datetime, timedelta
+from functools import lru_cache
 
 import pytz
 from dateutil.relativedelta import relativedelta
 from django.utils.timezone import get_current_timezone_name
 
 
+@lru_cache(maxsize=128)
 def seconds_to_human(value):
     value = int(value)
     days = value // 86400
@@ -1,21 +1,23 @@
 from copy import copy
+from functools import lru_cache
 
 from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.utils.text import format_lazy
 
 from .meta import absolute_url, get_server_root
 
 
-def project_meta(request):
-    # modify these values as needed and add whatever else you want globally available here
+@lru_cache(maxsize=1)
+def _get_settings_context() -> dict:
+    """The parts of the context that only depend on settings. They don't change while the process is running so
+    they are only built once."""
     project_data = copy(settings.PROJECT_METADATA)
-    project_data["TITLE"] = "{} | {}".format(project_data["NAME"], project_data["DESCRIPTION"])
+    # lazy so that the title is still translated per request
+    project_data["TITLE"] = format_lazy("{} | {}", project_data["NAME"], project_data["DESCRIPTION"])
     return {
         "project_meta": project_data,
-        "server_url": get_server_root(),
-        "page_url": absolute_url(request.path),
-        "page_title": "",
-        "page_description": "",
-        "page_image": "",
         # put any settings you want made available to all templates here
         # then reference them as {{ project_settings.MY_VALUE }} in templates
         "project_settings": {
@@ -26,6 +28,24 @@ def project_meta(request):
     }
 
 
+@receiver(setting_changed)
+def _clear_settings_context(**kwargs):
+    """Settings only change at runtime in tests (e.g. `override_settings`) which must see the new values"""
+    _get_settings_context.cache_clear()
+
+
+def project_meta(request):
+    # modify these values as needed and add whatever else you want globally available here
+    return {
+        **_get_settings_context(),
+        "server_url": get_server_root(),
+        "page_url": absolute_url(request.path),
+        "page_title": "",
+        "page_description": "",
+        "page_image": "",
+    }
+
+
 def google_analytics_id(request):
     """
     Adds google analytics id to all requests
@@ -0,0 +1,13 @@
+import pytest
+from django.test import RequestFactory, override_settings
+
+from apps.web.context_processors import project_meta
+
+
+@pytest.mark.django_db()
+def test_project_meta_reflects_overridden_settings():
+    request = RequestFactory().get("/")
+    with override_settings(SIGNUP_ENABLED=True):
+        assert project_meta(request)["signup_enabled"] is True
+    with override_settings(SIGNUP_ENABLED=False):
+        assert project_meta(request)["signup_enabled"] is False
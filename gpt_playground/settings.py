@@ -129,6 +129,9 @@ _DEFAULT_LOADERS = [
 
 _CACHED_LOADERS = [("django.template.loaders.cached.Loader", _DEFAULT_LOADERS)]
 
+# set PRECOMPILE_TEMPLATES to also cache templates in non-production environments e.g. staging
+_USE_CACHED_LOADERS = not DEBUG or env.bool("PRECOMPILE_TEMPLATES", default=False)
+
 TEMPLATES = [
     {
         "BACKEND": "django.template.backends.django.DjangoTemplates",
@@ -146,7 +149,7 @@ TEMPLATES = [
                 # this line can be removed if not using google analytics
                 "apps.web.context_processors.google_analytics_id",
             ],
-            "loaders": _DEFAULT_LOADERS if DEBUG else _CACHED_LOADERS,
+            "loaders": _CACHED_LOADERS if _USE_CACHED_LOADERS else _DEFAULT_LOADERS,
         },
     },
 ]
@@ -163,7 +166,7 @@ if "DATABASE_URL" in env:
 else:
     DATABASES = {
         "default": {
-            "ENGINE": "django.db.backends.postgresql_psycopg2",
+            "ENGINE": "django.db.backends.postgresql",
             "NAME": env("DJANGO_DATABASE_NAME", default="gpt_playground"),
             "USER": env("DJANGO_DATABASE_USER", default="postgres"),
             "PASSWORD": env("DJANGO_DATABASE_PASSWORD", default="***"),
@@ -172,6 +175,11 @@ else:
         }
     }
 
+# Reuse database connections across requests and tasks instead of connecting for each one. Celery's Django
+# fixup already closes the inherited connections when worker processes start.
+DATABASES["default"]["CONN_MAX_AGE"] = env.int("DJANGO_DATABASE_CONN_MAX_AGE", default=600)
+DATABASES["default"]["CONN_HEALTH_CHECKS"] = True
+
 # Auth / login stuff
 
 # Django recommends overriding the user model even if you don't think you need to because it makes
@@ -322,8 +330,10 @@ DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
 # Email setup
 
-# use in development
-EMAIL_BACKEND = "django.core.mail.backends.console.EmailBackend"
+# use in development. Set DJANGO_EMAIL_BACKEND to e.g. "django.core.mail.backends.filebased.EmailBackend" (with
+# EMAIL_FILE_PATH) to keep emails out of the console.
+EMAIL_BACKEND = env("DJANGO_EMAIL_BACKEND", default="django.core.mail.backends.console.EmailBackend")
+EMAIL_FILE_PATH = env("EMAIL_FILE_PATH", default=None)
 # use in production
 # see https://github.com/anymail/django-anymail for more details/examples
 # EMAIL_BACKEND = "anymail.backends.mailgun.EmailBackend"
@@ -447,8 +457,8 @@ LOGGING = {
     "disable_existing_loggers": False,
     "formatters": {
         "verbose": {
-            "format": '[{asctime}] {levelname} "{name}" {message}',
-            "style": "{",
+            "format": '[%(asctime)s] %(levelname)s "%(name)s" %(message)s',
+            "style": "%",
             "datefmt": "%d/%b/%Y %H:%M:%S",  # match Django server time format
         },
     },
@@ -1,7 +1,22 @@
 from .settings import *  # noqa F401
+from .settings import _CACHED_LOADERS
 
 DEBUG = False
 
+# the loaders are picked in settings.py based on DEBUG so they need updating here too
+TEMPLATES[0]["OPTIONS"]["loaders"] = _CACHED_LOADERS
+
+# this backend only checks that permissions exist when DEBUG is on
+AUTHENTICATION_BACKENDS = tuple(
+    backend for backend in AUTHENTICATION_BACKENDS if backend != "apps.teams.backends.PermissionCheckBackend"
+)
+
+# static files are collected with these settings (see Dockerfile.web) so the manifest is always available. The hashed
+# file names let whitenoise serve them with far-future cache headers.
+STORAGES["staticfiles"] = {
+    "BACKEND": "whitenoise.storage.CompressedManifestStaticFilesStorage",
+}
+
 # fix ssl mixed content issues
 SECURE_PROXY_SSL_HEADER = ("HTTP_X_FORWARDED_PROTO", "https")
 